@@ -14,7 +14,6 @@ sys.path.insert(0, str(project_root))
 from src.logging_config import setup_logging
 from src.memory.conversation_memory import ConversationMemory
 import structlog
-import json
 
 # Setup structured logging
 setup_logging(log_level="INFO")
@@ -42,7 +41,7 @@ def main():
     
     # Get all conversation keys
     try:
-        all_keys = memory.redis_client.keys("conversation:*")
+        all_keys = list(memory.redis_client.scan_iter(match="conversation:*", count=1000))
         
         if not all_keys:
             logger.info("no_conversations_found")
@@ -61,10 +60,9 @@ def main():
             print("=" * 80)
             
             # Get the conversation
-            conversation_json = memory.redis_client.get(key)
+            conversation = memory.get_conversation(key.split(":", 1)[1])
             
-            if conversation_json:
-                conversation = json.loads(conversation_json)
+            if conversation:
                 
                 logger.debug(
                     "conversation_inspected",
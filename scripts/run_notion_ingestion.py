@@ -6,9 +6,15 @@ Usage:
     # Ingest a specific registered source
     python scripts/run_notion_ingestion.py --source operations-department
     
-    # Ingest all registered sources
+    # Ingest all registered sources (sources unchanged since their last run are skipped)
     python scripts/run_notion_ingestion.py --all
     
+    # Re-ingest even if unchanged
+    python scripts/run_notion_ingestion.py --all --force
+    
+    # Full re-ingest of large sources at Batch API prices
+    python scripts/run_notion_ingestion.py --all --clear --batch-api
+    
     # Dry run (no embedding/storage, just test loading + chunking)
     python scripts/run_notion_ingestion.py --source operations-department --dry-run
     
@@ -81,8 +87,10 @@ def print_result(result: IngestionResult):
     """Print a single ingestion result."""
     status_icons = {
         "success": "✅",
+        "partial": "⚠️",
         "failed": "❌",
         "skipped": "⏭️",
+        "unchanged": "💤",
         "dry_run": "🧪",
     }
     
@@ -92,7 +100,7 @@ def print_result(result: IngestionResult):
     print(f"   Status: {result.status}")
     print(f"   Namespace: {result.namespace}")
     
-    if result.status in ("success", "dry_run"):
+    if result.status in ("success", "partial", "dry_run"):
         print(f"   Documents: {result.documents_loaded}")
         print(f"   Chunks: {result.chunks_created}")
         print(f"   Duration: {result.duration_seconds:.1f}s")
@@ -212,6 +220,16 @@ Examples:
         action="store_true",
         help="Load and chunk only, don't embed or store"
     )
+    parser.add_argument(
+        "--force", "-f",
+        action="store_true",
+        help="Re-ingest even if the source is unchanged since the last run"
+    )
+    parser.add_argument(
+        "--batch-api",
+        action="store_true",
+        help="Embed large sources via the OpenAI Batch API (half price, may take hours)"
+    )
     parser.add_argument(
         "--no-nested",
         action="store_true",
@@ -274,6 +292,8 @@ Examples:
             dry_run=args.dry_run,
             include_nested=not args.no_nested,
             include_files=not args.no_files,
+            force=args.force,
+            batch_api=args.batch_api,
         )
         
         print_result(result)
@@ -281,7 +301,7 @@ Examples:
         if result.status == "success":
             print_namespace_stats(pipeline, args.namespace)
         
-        sys.exit(0 if result.status in ("success", "dry_run") else 1)
+        sys.exit(0 if result.status in ("success", "unchanged", "dry_run") else 1)
     
     # Handle --all
     if args.all:
@@ -294,6 +314,8 @@ Examples:
         result = pipeline.ingest_all(
             clear_existing=args.clear,
             dry_run=args.dry_run,
+            force=args.force,
+            batch_api=args.batch_api,
         )
         
         print_pipeline_result(result)
@@ -321,6 +343,8 @@ Examples:
             source_key=args.source,
             clear_existing=args.clear,
             dry_run=args.dry_run,
+            force=args.force,
+            batch_api=args.batch_api,
         )
         
         print_result(result)
@@ -329,7 +353,7 @@ Examples:
             print_namespace_stats(pipeline, source.namespace)
         
         print()
-        sys.exit(0 if result.status in ("success", "dry_run") else 1)
+        sys.exit(0 if result.status in ("success", "unchanged", "dry_run") else 1)
     
     # No action specified
     print("❌ No action specified. Use one of:")
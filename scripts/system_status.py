@@ -145,7 +145,7 @@ def check_redis(config):
         connected_clients = info_data.get("connected_clients", "?")
 
         # Count conversation keys
-        conv_keys = len(r.keys("conversation:*"))
+        conv_keys = sum(1 for _ in r.scan_iter(match="conversation:*", count=1000))
 
         ok(f"Connected  →  {config.redis_host}:{config.redis_port}")
         info("Memory used", used_memory)
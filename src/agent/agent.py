@@ -18,13 +18,17 @@ Drop-in replacement for QueryEngine.
 backend/engine.py swaps one import — nothing else changes.
 """
 
+import dataclasses
+import time
 import structlog
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional
 import anthropic
 
 from src.config import Config, get_config
 from src.agent.models import QueryResponse, RetrievedChunk
+from src.agent.query_cache import QueryCache
 from src.agent.tools import KnowledgeBaseSearcher, SEARCH_KNOWLEDGE_BASE_TOOL
 from src.agent.system_prompt import ACTIVE_SYSTEM_PROMPT, ACTIVE_SYSTEM_PROMPT_VERSION
 from src.memory.conversation_memory import ConversationMemory
@@ -38,6 +42,21 @@ CLAUDE_MODEL = "claude-sonnet-4-6"
 # Prevents infinite loops if Claude gets confused. In practice it searches 1-3 times.
 MAX_TOOL_CALLS = 5
 
+# Phrases that mark an answer as "no answer found" (admin dashboard + Supabase logging).
+# Module-level tuples so they're built once, not on every query.
+NO_ANSWER_PHRASES = (
+    "geen informatie gevonden",
+    "niet gevonden",
+    "weet ik niet",
+    "kan ik niet",
+    "geen antwoord",
+    "geen relevante",
+)
+
+# Input patterns rejected by _sanitize_question (matched against lowercased input)
+BLOCKED_HTML_PATTERNS = ("<script", "</script>", "<iframe", "javascript:", "onerror=", "onload=")
+BLOCKED_SQL_PATTERNS = ("'; drop", '"; drop', "' or '1'='1", "';--", '";--')
+
 
 class YamieAgent:
     """
@@ -67,6 +86,10 @@ class YamieAgent:
             self.client = anthropic.Anthropic(api_key=self.config.anthropic_api_key)
             self.searcher = KnowledgeBaseSearcher(config=self.config)
             self.memory = ConversationMemory(config=self.config)
+            self.query_cache = (
+                QueryCache(self.config.query_cache_size, self.config.query_cache_ttl_seconds)
+                if self.config.query_cache_ttl_seconds > 0 else None
+            )
 
             logger.info(
                 "yamie_agent_initialized",
@@ -100,7 +123,7 @@ class YamieAgent:
             QueryResponse with answer, all retrieved chunks, and timing metadata.
             Identical shape to what the old QueryEngine returned.
         """
-        query_start = datetime.utcnow()
+        query_start = time.perf_counter()
 
         # Sanitize and validate input
         try:
@@ -115,6 +138,23 @@ class YamieAgent:
         # This is the correct way to pass history to Claude — native message format,
         # NOT a string injection hack.
         conversation = self.memory.get_conversation(user_id)
+
+        # Standalone questions (no history to depend on) can be served from the cache.
+        # Keys include the knowledge-base content version, so answers from before
+        # an ingest/sync are never reused (version unknown → don't cache).
+        cache_key = None
+        content_version = (
+            self.memory.get_content_version()
+            if self.query_cache is not None and not conversation else None
+        )
+        if content_version is not None:
+            cache_key = QueryCache.make_key(
+                question, top_k or self.config.query_top_k, ACTIVE_SYSTEM_PROMPT_VERSION, content_version
+            )
+            cached = self.query_cache.get(cache_key)
+            if cached is not None:
+                return self._cached_response(cached, question, user_id, query_start)
+
         messages = self._build_messages(conversation, question)
 
         # Accumulate all chunks retrieved during this query for admin dashboard logging
@@ -168,11 +208,10 @@ class YamieAgent:
 
                 tool_calls_made += len(tool_use_blocks)
 
-                # Execute each requested search and collect results
-                tool_results = []
+                # Log each requested search, then run them — concurrently when
+                # Claude asked for several at once (they're independent round-trips)
                 for tool_use_block in tool_use_blocks:
                     tool_input = tool_use_block.input
-
                     logger.info(
                         "tool_called",
                         call_number=tool_calls_made,
@@ -181,16 +220,19 @@ class YamieAgent:
                         top_k=tool_input.get("top_k"),
                     )
 
-                    try:
-                        passed, filtered = self.searcher.search(
-                            query=tool_input["query"],
-                            namespaces=tool_input.get("namespaces"),
-                            top_k=tool_input.get("top_k") or top_k or self.config.query_top_k,
-                        )
-                    except Exception as e:
-                        logger.error("tool_execution_failed", error=str(e))
-                        passed, filtered = [], []
-
+                search_inputs = [block.input for block in tool_use_blocks]
+                if len(search_inputs) > 1:
+                    with ThreadPoolExecutor(max_workers=len(search_inputs)) as executor:
+                        search_results = list(executor.map(
+                            lambda tool_input: self._run_search(tool_input, top_k),
+                            search_inputs,
+                        ))
+                else:
+                    search_results = [self._run_search(search_inputs[0], top_k)]
+
+                # Collect results in block order — one tool_result per tool_use_id
+                tool_results = []
+                for tool_use_block, (passed, filtered) in zip(tool_use_blocks, search_results):
                     all_passed_chunks.extend(passed)
                     all_filtered_chunks.extend(filtered)
 
@@ -250,19 +292,12 @@ class YamieAgent:
             except Exception as e:
                 logger.warning("memory_save_failed", error=str(e), user_id=user_id)
 
-        total_time = (datetime.utcnow() - query_start).total_seconds()
+        total_time = time.perf_counter() - query_start
 
         # Determine has_answer — used by admin dashboard and Supabase logging
+        answer_lower = final_answer.lower()
         has_answer = bool(final_answer) and not any(
-            phrase in final_answer.lower()
-            for phrase in [
-                "geen informatie gevonden",
-                "niet gevonden",
-                "weet ik niet",
-                "kan ik niet",
-                "geen antwoord",
-                "geen relevante",
-            ]
+            phrase in answer_lower for phrase in NO_ANSWER_PHRASES
         )
 
         logger.info(
@@ -275,7 +310,7 @@ class YamieAgent:
             has_answer=has_answer,
         )
 
-        return QueryResponse(
+        query_response = QueryResponse(
             question=question,
             answer=final_answer,
             sources=all_passed_chunks,
@@ -284,6 +319,12 @@ class YamieAgent:
             filtered_chunks=all_filtered_chunks,
         )
 
+        # Only real answers are cached — "not found" may change after a re-ingest
+        if cache_key is not None and has_answer:
+            self.query_cache.put(cache_key, query_response)
+
+        return query_response
+
     # ── Private helpers ───────────────────────────────────────────────────────
 
     def _build_messages(self, conversation: list[dict], current_question: str) -> list[dict]:
@@ -306,6 +347,22 @@ class YamieAgent:
 
         return messages
 
+    def _run_search(
+        self,
+        tool_input: dict,
+        top_k: Optional[int],
+    ) -> tuple[list[RetrievedChunk], list[RetrievedChunk]]:
+        """Execute one search_knowledge_base call. A failed search yields no chunks."""
+        try:
+            return self.searcher.search(
+                query=tool_input["query"],
+                namespaces=tool_input.get("namespaces"),
+                top_k=tool_input.get("top_k") or top_k or self.config.query_top_k,
+            )
+        except Exception as e:
+            logger.error("tool_execution_failed", error=str(e))
+            return [], []
+
     def _serialize_content(self, content) -> list[dict]:
         """
         Serialize Claude response content blocks to plain dicts.
@@ -361,25 +418,54 @@ class YamieAgent:
         question_lower = question.lower()
 
         # Block HTML/script injection
-        for pattern in ["<script", "</script>", "<iframe", "javascript:", "onerror=", "onload="]:
+        for pattern in BLOCKED_HTML_PATTERNS:
             if pattern in question_lower:
                 raise ValueError("HTML/script patronen zijn niet toegestaan in vragen.")
 
         # Block obvious SQL injection patterns
-        for pattern in ["'; drop", '"; drop', "' or '1'='1", "';--", '";--']:
+        for pattern in BLOCKED_SQL_PATTERNS:
             if pattern in question_lower:
                 raise ValueError("Injectiepatronen gedetecteerd in de vraag.")
 
         return question
 
-    def _error_response(self, question: str, query_start: datetime) -> QueryResponse:
+    def _cached_response(
+        self,
+        cached: QueryResponse,
+        question: str,
+        user_id: str,
+        query_start: float,
+    ) -> QueryResponse:
+        """Serve a cached answer: still saved as a conversation turn, with fresh timing."""
+        try:
+            self.memory.add_turn(user_id, question, cached.answer)
+        except Exception as e:
+            logger.warning("memory_save_failed", error=str(e), user_id=user_id)
+
+        total_time = time.perf_counter() - query_start
+        logger.info(
+            "agent_query_completed",
+            user_id=user_id,
+            response_time_seconds=round(total_time, 3),
+            cache_hit=True,
+            has_answer=cached.has_answer,
+        )
+
+        return dataclasses.replace(
+            cached,
+            question=question,
+            response_time_seconds=total_time,
+            timestamp=datetime.utcnow().isoformat(),
+        )
+
+    def _error_response(self, question: str, query_start: float) -> QueryResponse:
         """Create a safe error response when something goes wrong."""
         return QueryResponse(
             question=question,
             answer="Sorry, er is een fout opgetreden. Probeer het opnieuw.",
             sources=[],
             has_answer=False,
-            response_time_seconds=(datetime.utcnow() - query_start).total_seconds(),
+            response_time_seconds=time.perf_counter() - query_start,
         )
 
     def get_stats(self) -> dict:
@@ -394,6 +480,7 @@ class YamieAgent:
 
         return {
             "retriever": retriever_stats,
+            "query_cache": self.query_cache.get_stats() if self.query_cache else None,
             "config": {
                 "top_k": self.config.query_top_k,
                 "similarity_threshold": self.config.query_similarity_threshold,
@@ -0,0 +1,93 @@
+"""
+QueryCache — in-process LRU cache of answers to standalone questions.
+
+Every query runs the full agentic loop: one or more Claude calls plus a
+Pinecone search per tool call — seconds of latency. FAQ-style traffic asks
+the same questions over and over, so answers are cached by question.
+
+Only standalone questions are cached: with conversation history, the answer
+depends on the earlier turns, not just on the question. The agent puts the
+knowledge-base content version (bumped in Redis by every ingest and sync) in
+the key, so new content shows up right away in every process; the TTL only
+bounds staleness if that version can't be bumped.
+
+Usage:
+    from src.agent.query_cache import QueryCache
+
+    cache = QueryCache(max_size=256, ttl_seconds=600)
+    key = cache.make_key(question, top_k)
+    response = cache.get(key)
+    if response is None:
+        response = ...  # run the agent
+        cache.put(key, response)
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from src.agent.models import QueryResponse
+
+
+class QueryCache:
+    """
+    Thread-safe LRU map of question key → QueryResponse, with a TTL.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, tuple[float, QueryResponse]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(question: str, *parts) -> str:
+        """
+        Cache key for a (sanitized) question plus anything else the answer depends on.
+
+        Case and whitespace are normalized, so "Wie is Daoud?" and
+        "wie is  daoud?" share an entry.
+        """
+        normalized = " ".join(question.casefold().split())
+        raw = "\0".join([normalized, *(str(part) for part in parts)])
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[QueryResponse]:
+        """Cached response for a key, or None (missing or expired)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[0] >= self.ttl_seconds:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: str, response: QueryResponse) -> None:
+        """Store a response, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry (e.g. after a re-ingest)."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
@@ -11,6 +11,7 @@ Embeddings still use OpenAI text-embedding-3-large (must match what was ingested
 
 import json
 import structlog
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from openai import OpenAI
 from pinecone import Pinecone
@@ -121,6 +122,13 @@ class KnowledgeBaseSearcher:
         self._pinecone_client = Pinecone(api_key=self.config.pinecone_api_key)
         self._index = self._pinecone_client.Index(self.config.pinecone_index_name)
 
+        # Namespace queries are independent network round-trips — fan them out.
+        # Long-lived so a search doesn't pay for spawning threads.
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(NAMESPACES),
+            thread_name_prefix="kb-search",
+        )
+
         logger.info(
             "knowledge_base_searcher_initialized",
             index=self.config.pinecone_index_name,
@@ -189,6 +197,49 @@ class KnowledgeBaseSearcher:
 
         return ""
 
+    def _search_namespace(
+        self,
+        vector: list[float],
+        namespace: str,
+        top_k: int,
+    ) -> list[RetrievedChunk]:
+        """Query one namespace and convert its matches. A failed namespace yields no chunks."""
+        chunks: list[RetrievedChunk] = []
+        try:
+            matches = self._query_namespace(vector, namespace, top_k)
+
+            for match in matches:
+                metadata = match.get("metadata", {})
+                text = self._extract_text(metadata)
+
+                if not text:
+                    logger.warning(
+                        "empty_chunk_skipped",
+                        match_id=match.get("id"),
+                        namespace=namespace,
+                    )
+                    continue
+
+                # Prefer descriptive source_path over raw file_name
+                source = metadata.get("source_path") or metadata.get("file_name", "unknown")
+
+                chunks.append(RetrievedChunk(
+                    text=text,
+                    source=source,
+                    category=metadata.get("category", "general"),
+                    similarity_score=match.get("score", 0.0),
+                    metadata={**metadata, "namespace": namespace},
+                ))
+
+        except Exception as e:
+            logger.warning(
+                "namespace_search_failed",
+                namespace=namespace,
+                error=str(e),
+            )
+
+        return chunks
+
     def search(
         self,
         query: str,
@@ -216,41 +267,13 @@ class KnowledgeBaseSearcher:
             logger.error("embedding_failed", query=query[:100], error=str(e))
             return [], []
 
+        # One Pinecone query per namespace, concurrently (results keep namespace order)
         all_chunks: list[RetrievedChunk] = []
-
-        for namespace in namespaces_to_search:
-            try:
-                matches = self._query_namespace(query_vector, namespace, top_k)
-
-                for match in matches:
-                    metadata = match.get("metadata", {})
-                    text = self._extract_text(metadata)
-
-                    if not text:
-                        logger.warning(
-                            "empty_chunk_skipped",
-                            match_id=match.get("id"),
-                            namespace=namespace,
-                        )
-                        continue
-
-                    # Prefer descriptive source_path over raw file_name
-                    source = metadata.get("source_path") or metadata.get("file_name", "unknown")
-
-                    all_chunks.append(RetrievedChunk(
-                        text=text,
-                        source=source,
-                        category=metadata.get("category", "general"),
-                        similarity_score=match.get("score", 0.0),
-                        metadata={**metadata, "namespace": namespace},
-                    ))
-
-            except Exception as e:
-                logger.warning(
-                    "namespace_search_failed",
-                    namespace=namespace,
-                    error=str(e),
-                )
+        for chunks in self._executor.map(
+            lambda namespace: self._search_namespace(query_vector, namespace, top_k),
+            namespaces_to_search,
+        ):
+            all_chunks.extend(chunks)
 
         # Sort highest score first, then split by threshold
         all_chunks.sort(key=lambda c: c.similarity_score, reverse=True)
@@ -13,12 +13,32 @@ class Config:
     openai_api_key: str = os.getenv("OPENAI_API_KEY", "")
     embedding_model: str = "text-embedding-3-large"
     embedding_dimensions: int = 3072
-    embedding_batch_size: int = 100
+    # Max inputs per OpenAI embeddings request when tiktoken isn't installed.
+    # OpenAI caps a request at 2048 inputs AND 300k tokens; 200 chunks (~240k
+    # tokens worst case) stays under both. With tiktoken, requests are packed
+    # by token count up to the API caps instead.
+    embedding_batch_size: int = 200
+    # Embedding requests in flight at once (each is network-bound; the OpenAI
+    # client retries 429s itself if this outruns the account's rate limit)
+    embedding_concurrency: int = 4
+    # Account tokens-per-minute limit for the embedding model; requests are paced
+    # to stay under it (0 = no pacing, rely on the client's 429 retries)
+    embedding_tokens_per_minute: int = int(os.getenv("EMBEDDING_TOKENS_PER_MINUTE") or 0)
+    # Content-addressed cache of chunk embeddings ("off" to disable)
+    embedding_cache_dir: str = os.getenv("EMBEDDING_CACHE_DIR") or "~/.cache/yamie/embeddings"
+    # Opt-in Batch API embedding (--batch-api): half price, results within 24h.
+    # Only used for sources with at least this many chunks; needs the cache.
+    batch_api_threshold: int = 10000
+    batch_api_poll_seconds: int = 60
 
     # Pinecone
     pinecone_api_key: str = os.getenv("PINECONE_API_KEY", "")
     pinecone_index_name: str = os.getenv("PINECONE_INDEX_NAME", "yamie-knowledge")
     pinecone_namespace: str = os.getenv("PINECONE_NAMESPACE", "operations-department")
+    # Vectors per upsert request (PineconeVectorStore's default) and upsert
+    # requests in flight at once
+    pinecone_upsert_batch_size: int = 100
+    pinecone_upsert_concurrency: int = 4
 
     # Notion Integration
     notion_api_key: str = os.getenv("NOTION_API_KEY", "")
@@ -26,10 +46,21 @@ class Config:
     # Chunking
     chunk_size: int = 1000
     chunk_overlap: int = 200
+    min_chunk_chars: int = 32              # Shorter chunks are dropped (unless a document's only chunk)
+
+    # Ingestion: Notion sources ingested at once by ingest_all (they share one
+    # Notion rate limiter, so this overlaps OpenAI/Pinecone waits, not Notion's)
+    max_concurrent_sources: int = 3
+    # Fingerprints of each namespace's last ingestion, so unchanged sources are
+    # skipped ("off" to always re-ingest)
+    ingestion_manifest_dir: str = os.getenv("INGESTION_MANIFEST_DIR") or "~/.cache/yamie"
 
     # Query/Retrieval Settings
     query_top_k: int = 10                  # Number of chunks to retrieve
     query_similarity_threshold: float = 0.35
+    # In-process cache of answers to standalone (no-history) questions
+    query_cache_size: int = 256
+    query_cache_ttl_seconds: int = 600     # 0 = disabled; bounds staleness if Redis misses a re-ingest
     
     # LLM Settings
     llm_model: str = "claude-sonnet-4-6"   # Used for logging — must match constant in src/agent/agent.py
@@ -59,6 +90,10 @@ class Config:
     # Memory Settings
     conversation_ttl_seconds: int = 1800  # 30 minutes (1800 seconds)
     max_conversation_turns: int = 5  # Remember last N Q&A pairs
+    # In-process copy of recent conversations (saves the Redis read per query).
+    # Off by default: only safe when a single process answers for all users —
+    # another process's turns never reach this copy. Set to e.g. 1024 to enable.
+    conversation_cache_size: int = 0
 
     def validate(self):
         """Validate all configuration"""
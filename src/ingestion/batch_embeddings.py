@@ -0,0 +1,167 @@
+"""
+Batch Embeddings - Embed large ingestions through the OpenAI Batch API.
+
+The Batch API costs half the real-time price and has its own, much higher
+rate limits, in exchange for results within 24 hours (usually far sooner).
+For a full re-ingest of a large corpus that trade is worth it.
+
+Results land in the embedding cache rather than in memory: holding thousands
+of 3072-dim vectors as Python lists would take gigabytes, while the normal
+pipeline already reads vectors from the cache when it embeds — so after the
+batch completes, every chunk is a cache hit and nothing else changes.
+
+Flow:
+1. Skip inputs that are already cached
+2. Pack the rest into /v1/embeddings requests (same limits as real-time)
+3. Upload a JSONL file, create the batch, poll until it finishes
+4. Stream the output file into the cache
+
+Usage:
+    from src.ingestion.batch_embeddings import embed_via_batch_api
+
+    embed_via_batch_api(texts, config, cache)
+    embed_nodes(nodes, embed_model, cache)  # all hits
+"""
+
+import json
+import tempfile
+import time
+import structlog
+from pathlib import Path
+from typing import List
+
+from src.config import Config
+from src.ingestion.embedding_cache import (
+    EmbeddingCache,
+    MAX_INPUTS_PER_REQUEST,
+    pack_batches,
+    count_tokens,
+)
+
+logger = structlog.get_logger(__name__)
+
+
+# Batch API limit on requests per input file
+MAX_REQUESTS_PER_BATCH = 50_000
+
+BATCH_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+def embed_via_batch_api(texts: List[str], config: Config, cache: EmbeddingCache) -> int:
+    """
+    Embed texts with the Batch API and store the vectors in the cache.
+
+    Blocks until the batch finishes (polling every config.batch_api_poll_seconds).
+
+    Args:
+        texts: Embedding inputs (node.get_content(metadata_mode=EMBED))
+        config: Config (embedding model, dimensions, polling interval)
+        cache: EmbeddingCache the vectors are written to
+
+    Returns:
+        Number of inputs embedded (cache hits excluded)
+
+    Raises:
+        RuntimeError: If the batch doesn't complete or any request in it failed
+    """
+    unique_texts = list(dict.fromkeys(texts))
+    cached = cache.get_many(unique_texts)
+    miss_texts = [text for text in unique_texts if text not in cached]
+    if not miss_texts:
+        logger.info("batch_embedding_skipped", reason="all_cached", inputs=len(unique_texts))
+        return 0
+
+    token_counts = count_tokens(miss_texts, config.embedding_model)
+    if token_counts is None:
+        requests = [
+            miss_texts[i:i + config.embedding_batch_size]
+            for i in range(0, len(miss_texts), config.embedding_batch_size)
+        ]
+    else:
+        requests = pack_batches(miss_texts, token_counts, MAX_INPUTS_PER_REQUEST)
+
+    if len(requests) > MAX_REQUESTS_PER_BATCH:
+        raise RuntimeError(
+            f"{len(requests)} embedding requests exceed the Batch API limit of {MAX_REQUESTS_PER_BATCH}"
+        )
+
+    # Imported here: only batch ingestions need the raw client
+    from openai import OpenAI
+
+    client = OpenAI(api_key=config.openai_api_key)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        input_path = Path(tmp_dir) / "embedding_requests.jsonl"
+        with open(input_path, "w", encoding="utf-8") as f:
+            for i, batch in enumerate(requests):
+                f.write(json.dumps({
+                    "custom_id": str(i),
+                    "method": "POST",
+                    "url": "/v1/embeddings",
+                    "body": {
+                        "model": config.embedding_model,
+                        "dimensions": config.embedding_dimensions,
+                        "input": batch,
+                    },
+                }) + "\n")
+
+        with open(input_path, "rb") as f:
+            input_file = client.files.create(file=f, purpose="batch")
+
+    batch_job = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/embeddings",
+        completion_window="24h",
+    )
+
+    logger.info(
+        "batch_embedding_submitted",
+        batch_id=batch_job.id,
+        inputs=len(miss_texts),
+        requests=len(requests),
+        cache_hits=len(cached),
+    )
+
+    start = time.perf_counter()
+    while batch_job.status not in BATCH_TERMINAL_STATUSES:
+        time.sleep(config.batch_api_poll_seconds)
+        batch_job = client.batches.retrieve(batch_job.id)
+        logger.debug("batch_embedding_polled", batch_id=batch_job.id, status=batch_job.status)
+
+    if batch_job.status != "completed" or not batch_job.output_file_id:
+        raise RuntimeError(f"Embedding batch {batch_job.id} ended with status '{batch_job.status}'")
+
+    # Stream the output file and cache each request's vectors as its line is
+    # parsed — the file (JSON text of every vector) is never held in memory
+    embedded = 0
+    succeeded = 0
+    with client.files.with_streaming_response.content(batch_job.output_file_id) as output:
+        for line in output.iter_lines():
+            if not line.strip():
+                continue
+            result = json.loads(line)
+            response = result.get("response") or {}
+            if result.get("error") or response.get("status_code") != 200:
+                continue
+
+            batch = requests[int(result["custom_id"])]
+            data = sorted(response["body"]["data"], key=lambda item: item["index"])
+            cache.put_many(batch, [item["embedding"] for item in data])
+            embedded += len(batch)
+            succeeded += 1
+
+    # Failed requests are in the output file with an error, or only in the error file
+    failed = len(requests) - succeeded
+
+    logger.info(
+        "batch_embedding_complete",
+        batch_id=batch_job.id,
+        embedded=embedded,
+        failed_requests=failed,
+        duration_seconds=round(time.perf_counter() - start, 2),
+    )
+
+    if failed:
+        raise RuntimeError(f"Embedding batch {batch_job.id}: {failed} of {len(requests)} requests failed")
+
+    return embedded
@@ -4,7 +4,7 @@ Converts Documents into sentence-aware Nodes with comprehensive validation.
 """
 
 import structlog
-from typing import List
+from typing import List, Iterable, Iterator
 
 from llama_index.core.node_parser import SentenceSplitter
 from llama_index.core.schema import Document, BaseNode
@@ -74,12 +74,16 @@ class DocumentChunker:
             )
             raise ValueError(f"Chunk overlap cannot be negative: {self.config.chunk_overlap}")
 
-    def chunk(self, documents: List[Document]) -> List[BaseNode]:
+    def chunk(self, documents: Iterable[Document]) -> List[BaseNode]:
         """
         Chunk documents into nodes with sentence-aware splitting.
         
+        Documents are split one at a time, so a generator (e.g.
+        NotionLoader.iter_documents) is consumed without ever holding every
+        document in memory — only the resulting nodes are kept.
+        
         Args:
-            documents: List of Document objects to chunk
+            documents: Document objects to chunk (list or any iterable)
             
         Returns:
             List of BaseNode objects (chunks with metadata)
@@ -87,67 +91,114 @@ class DocumentChunker:
         Raises:
             ValueError: If no documents provided or chunking fails
         """
-        if not documents:
+        nodes = list(self.iter_chunk(documents))
+
+        # Calculate and log statistics
+        self._log_chunk_statistics(nodes)
+        return nodes
+
+    def iter_chunk(self, documents: Iterable[Document]) -> Iterator[BaseNode]:
+        """
+        Yield nodes document by document, without collecting them.
+        
+        Lets callers embed and store chunks while later documents are still
+        loading, holding only the chunks they haven't consumed yet.
+        
+        Args:
+            documents: Document objects to chunk (list or any iterable)
+            
+        Yields:
+            BaseNode objects (chunks with metadata)
+            
+        Raises:
+            ValueError: If no documents provided or chunking fails
+        """
+        logger.info("chunking_started")
+        
+        documents_count = 0
+        chunks_count = 0
+        filtered_count = 0
+        total_chars = 0
+        
+        # Prev/next node links never cross documents, so splitting one
+        # document per call gives the same nodes as one batched call
+        for document in documents:
+            try:
+                document_nodes = self.splitter.get_nodes_from_documents([document])
+            except Exception as e:
+                logger.error(
+                    "chunking_failed",
+                    error=str(e),
+                    error_type=type(e).__name__
+                )
+                raise ValueError(f"Failed to chunk documents: {e}")
+            documents_count += 1
+            
+            # Drop near-empty fragments (separators, stray headings) — they cost
+            # an embedding and pollute retrieval. A document's only chunk is kept
+            # however short, so one-line pages ("Sluitingstijd: 22:00") survive.
+            if len(document_nodes) > 1:
+                kept = [
+                    node for node in document_nodes
+                    if len(node.text.strip()) >= self.config.min_chunk_chars
+                ]
+                kept = kept or document_nodes[:1]
+                filtered_count += len(document_nodes) - len(kept)
+                document_nodes = kept
+            
+            # Size accounting rides along the walk the nodes get anyway, so
+            # streaming callers get chunk stats without a second pass
+            for node in document_nodes:
+                total_chars += len(node.text)
+                chunks_count += 1
+                yield node
+        
+        logger.debug("nodes_created", count=chunks_count, documents_count=documents_count, nodes_filtered=filtered_count)
+
+        if not documents_count:
             error_msg = "No documents provided for chunking"
             logger.error("chunking_failed", reason="no_documents")
             raise ValueError(error_msg)
 
-        logger.info(
-            "chunking_started",
-            documents_count=len(documents)
-        )
-        
-        try:
-            nodes = self.splitter.get_nodes_from_documents(documents)
-            logger.debug("nodes_created", count=len(nodes) if nodes else 0)
-        except Exception as e:
-            logger.error(
-                "chunking_failed",
-                error=str(e),
-                error_type=type(e).__name__
-            )
-            raise ValueError(f"Failed to chunk documents: {e}")
-
-        if not nodes:
+        if not chunks_count:
             error_msg = "No nodes created during chunking (documents may be empty)"
             logger.error(
                 "chunking_failed",
                 reason="no_nodes_created"
             )
             raise ValueError(error_msg)
-
-        # Calculate and log statistics
-        self._log_chunk_statistics(nodes)
         
         logger.info(
             "chunking_completed",
-            chunks_created=len(nodes)
+            documents_count=documents_count,
+            chunks_created=chunks_count,
+            nodes_filtered=filtered_count,
+            avg_chars=round(total_chars / chunks_count, 0)
         )
-        return nodes
 
     def _log_chunk_statistics(self, nodes: List[BaseNode]) -> None:
         """Calculate and log useful statistics about chunks."""
         if not nodes:
             return
         
-        # Character counts
-        char_counts = [len(node.text) for node in nodes]
-        total_chars = sum(char_counts)
-        avg_chars = total_chars / len(nodes)
-        min_chars = min(char_counts)
-        max_chars = max(char_counts)
+        # Character counts (sorted once: min/max/percentiles are index lookups)
+        char_counts = sorted(len(node.text) for node in nodes)
+        count = len(char_counts)
+        avg_chars = sum(char_counts) / count
         
-        # Word counts  
-        word_counts = [len(node.text.split()) for node in nodes]
-        avg_words = sum(word_counts) / len(nodes)
+        # Word counts
+        total_words = sum(len(node.text.split()) for node in nodes)
+        avg_words = total_words / count
         
         logger.info(
             "chunk_statistics",
-            total_chunks=len(nodes),
+            total_chunks=count,
             avg_chars=round(avg_chars, 0),
             avg_words=round(avg_words, 0),
-            min_chars=min_chars,
-            max_chars=max_chars
+            min_chars=char_counts[0],
+            p50_chars=char_counts[(count - 1) // 2],
+            p95_chars=char_counts[min(count - 1, int(count * 0.95))],
+            max_chars=char_counts[-1]
         )
 
     def inspect(self, nodes: List[BaseNode], num_samples: int = 4) -> None:
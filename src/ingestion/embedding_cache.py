@@ -0,0 +1,387 @@
+"""
+Embedding Cache - Content-addressed on-disk cache of chunk embeddings.
+
+Re-ingesting a source (or re-syncing a page where only a few paragraphs
+changed) re-embeds every chunk, even though most chunk texts are identical to
+the last run. Embeddings are a pure function of (model, dimensions, input
+text), so they are cached under a hash of exactly that.
+
+The hashed input is the text LlamaIndex actually embeds —
+node.get_content(metadata_mode=EMBED), i.e. chunk text plus the metadata
+header — so a metadata change correctly produces a miss.
+
+embed_nodes() sets node.embedding on every node before it is stored, so
+only misses reach OpenAI.
+
+Storage is a single SQLite file (stdlib, safe across threads and processes).
+Vectors are stored as float32, the precision Pinecone stores them in.
+
+Usage:
+    from src.ingestion.embedding_cache import embed_nodes, open_embedding_cache
+
+    cache = open_embedding_cache(config)  # None if disabled
+    embed_nodes(nodes, embed_model, cache)
+    vector_store.add(nodes)
+"""
+
+import hashlib
+import os
+import random
+import sqlite3
+import threading
+import time
+import structlog
+from array import array
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Dict, Optional
+
+from llama_index.core.schema import BaseNode, MetadataMode
+from tqdm import tqdm
+
+from src.config import Config
+
+logger = structlog.get_logger(__name__)
+
+# Optional: exact token counts (batch packing, cost estimates)
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+
+# OpenAI embeddings request limits (per request, not per minute). The token
+# cap keeps a small margin in case the API counts slightly differently.
+MAX_INPUTS_PER_REQUEST = 2048
+MAX_TOKENS_PER_REQUEST = 290_000
+
+# Upper bound of the random delay before each concurrent request, so a round
+# of batches doesn't hit the API (and then retry its 429s) in lockstep
+LAUNCH_JITTER_SECONDS = 0.1
+
+
+@lru_cache(maxsize=4)
+def get_encoding(model: Optional[str] = None):
+    """
+    tiktoken encoding for an OpenAI model, loaded once per process.
+
+    Falls back to cl100k_base (used by text-embedding-3) for models tiktoken
+    doesn't know. Requires TIKTOKEN_AVAILABLE.
+    """
+    if model:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            pass
+    return tiktoken.get_encoding("cl100k_base")
+
+
+def count_tokens(texts: List[str], model: Optional[str] = None) -> Optional[List[int]]:
+    """
+    Token count per text in `model`'s encoding, or None without tiktoken.
+
+    Encodes the whole list in one batched call, threaded inside tiktoken.
+    encode_ordinary skips special-token checks, which would raise on text
+    that happens to contain e.g. "<|endoftext|>".
+    """
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    token_lists = get_encoding(model).encode_ordinary_batch(
+        texts,
+        num_threads=max(1, (os.cpu_count() or 2) // 2),
+    )
+    return [len(tokens) for tokens in token_lists]
+
+
+def request_batch_size(config: Config) -> int:
+    """
+    embed_batch_size to give the embedding model.
+
+    With tiktoken, embed_nodes packs requests by token count, so the model
+    may take up to OpenAI's input cap per request (short chunks then need far
+    fewer requests). Without it, config.embedding_batch_size is the only guard.
+    """
+    return MAX_INPUTS_PER_REQUEST if TIKTOKEN_AVAILABLE else config.embedding_batch_size
+
+
+def pack_batches(
+    texts: List[str],
+    token_counts: List[int],
+    max_inputs: int,
+    max_tokens: int = MAX_TOKENS_PER_REQUEST,
+) -> List[List[str]]:
+    """Split texts into request batches of at most max_inputs inputs and max_tokens tokens."""
+    batches: List[List[str]] = []
+    batch: List[str] = []
+    batch_tokens = 0
+    for text, tokens in zip(texts, token_counts):
+        if batch and (len(batch) >= max_inputs or batch_tokens + tokens > max_tokens):
+            batches.append(batch)
+            batch, batch_tokens = [], 0
+        batch.append(text)
+        batch_tokens += tokens
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+class TokenBudget:
+    """
+    Rolling one-minute token budget shared by concurrent embedding requests.
+
+    reserve() blocks until sending `tokens` more keeps the last 60 seconds
+    under the tokens-per-minute limit, so requests are paced instead of being
+    sent, rejected with 429 and retried.
+    """
+
+    WINDOW_SECONDS = 60.0
+
+    def __init__(self, tokens_per_minute: int):
+        self.tokens_per_minute = tokens_per_minute
+        self._sent = deque()  # (monotonic time, tokens)
+        self._in_window = 0
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: int) -> float:
+        """Wait for room in the budget and record the tokens. Returns seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._sent and now - self._sent[0][0] >= self.WINDOW_SECONDS:
+                    self._in_window -= self._sent.popleft()[1]
+
+                # A single oversized request only has to wait for an empty window
+                if not self._sent or self._in_window + tokens <= self.tokens_per_minute:
+                    self._sent.append((now, tokens))
+                    self._in_window += tokens
+                    return waited
+
+                # Wait until the oldest entry leaves the window, then recheck
+                delay = self.WINDOW_SECONDS - (now - self._sent[0][0])
+
+            time.sleep(delay)
+            waited += delay
+
+
+def embed_nodes(
+    nodes: List[BaseNode],
+    embed_model,
+    cache: Optional["EmbeddingCache"] = None,
+    show_progress: bool = False,
+    concurrency: int = 1,
+    token_budget: Optional[TokenBudget] = None,
+) -> None:
+    """
+    Set node.embedding on every node that doesn't have one yet.
+
+    Nodes with identical embedding input (boilerplate headers, repeated PDF
+    pages, duplicated blocks) are grouped so each unique input is embedded —
+    and billed — once. With a cache, hits are served from disk and only the
+    unique misses go to embed_model (then get cached).
+
+    Misses are packed by token count into requests of up to
+    embed_model.embed_batch_size inputs and OpenAI's per-request token cap —
+    but no more than an even split across `concurrency`, so packing never
+    costs parallelism. Without tiktoken they go in fixed-size batches. Up to
+    `concurrency` requests are in flight at once (threads — the calls are
+    pure network wait). With a token_budget, each request first waits for
+    room under the tokens-per-minute limit. Concurrent requests start with a
+    small random stagger; 429s and timeouts are retried by the embedding model
+    itself (jittered exponential backoff). Each batch is cached as soon as
+    it returns, so a failure part-way through keeps the work already paid for.
+
+    Args:
+        nodes: Nodes to embed (modified in place)
+        embed_model: LlamaIndex embedding model
+        cache: Optional EmbeddingCache (None = no caching, dedup only)
+        show_progress: Show a progress bar while embedding
+        concurrency: Max embedding requests in flight
+        token_budget: Optional shared TokenBudget to pace requests under a TPM limit
+    """
+    pending = [node for node in nodes if node.embedding is None]
+    if not pending:
+        return
+
+    # Unique embedding input → nodes sharing it. Keyed on the full embedded
+    # content (metadata header included), not just node.text.
+    groups: Dict[str, List[BaseNode]] = {}
+    for node in pending:
+        groups.setdefault(node.get_content(metadata_mode=MetadataMode.EMBED), []).append(node)
+
+    unique_texts = list(groups)
+    vectors_by_text = cache.get_many(unique_texts) if cache else {}
+    miss_texts = [text for text in unique_texts if text not in vectors_by_text]
+
+    batches: List[List[str]] = []
+    if miss_texts:
+        batch_size = min(
+            getattr(embed_model, "embed_batch_size", None) or MAX_INPUTS_PER_REQUEST,
+            MAX_INPUTS_PER_REQUEST,
+        )
+        token_counts = count_tokens(miss_texts, getattr(embed_model, "model_name", None))
+        if token_counts is None:
+            # No tokenizer: fixed-size batches (sized for worst-case chunks)
+            batches = [miss_texts[i:i + batch_size] for i in range(0, len(miss_texts), batch_size)]
+            tokens_by_text = {}
+        else:
+            # Even share per worker, so e.g. 800 short chunks become 4
+            # parallel requests rather than 1
+            token_target = -(-sum(token_counts) // max(1, concurrency))
+            batches = pack_batches(
+                miss_texts,
+                token_counts,
+                batch_size,
+                max_tokens=min(MAX_TOKENS_PER_REQUEST, token_target),
+            )
+            tokens_by_text = dict(zip(miss_texts, token_counts))
+        workers = max(1, min(concurrency, len(batches)))
+
+        def embed_batch(batch: List[str]) -> List[List[float]]:
+            if workers > 1:
+                time.sleep(random.uniform(0, LAUNCH_JITTER_SECONDS))
+            if token_budget is not None and tokens_by_text:
+                token_budget.reserve(sum(tokens_by_text[text] for text in batch))
+            return embed_model.get_text_embedding_batch(batch)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(embed_batch, batch): batch for batch in batches}
+            for future in tqdm(as_completed(futures), total=len(futures), desc="Embedding", disable=not show_progress):
+                batch = futures[future]
+                vectors = future.result()
+                vectors_by_text.update(zip(batch, vectors))
+                if cache:
+                    cache.put_many(batch, vectors)
+
+    for text, group in groups.items():
+        vector = vectors_by_text[text]
+        for node in group:
+            node.embedding = vector
+
+    logger.info(
+        "nodes_embedded",
+        nodes=len(pending),
+        unique_inputs=len(unique_texts),
+        deduplicated_count=len(pending) - len(unique_texts),
+        cache_hits=len(unique_texts) - len(miss_texts),
+        embedded=len(miss_texts),
+        requests=len(batches),
+    )
+
+
+def open_embedding_cache(config: Config) -> Optional["EmbeddingCache"]:
+    """
+    Open the embedding cache configured by config.embedding_cache_dir.
+
+    Returns None if the cache is disabled ("off") or can't be opened —
+    embed_nodes then runs without caching.
+    """
+    cache_dir = config.embedding_cache_dir
+    if not cache_dir or cache_dir.lower() == "off":
+        return None
+
+    try:
+        return EmbeddingCache(
+            cache_dir,
+            model=config.embedding_model,
+            dimensions=config.embedding_dimensions,
+        )
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("embedding_cache_disabled", cache_dir=cache_dir, error=str(e))
+        return None
+
+
+class EmbeddingCache:
+    """
+    SQLite-backed cache of embeddings for one (model, dimensions) pair.
+
+    One row per embedded input: (key, vector as float32 bytes).
+    The key is a BLAKE2b digest of model, dimensions and input text.
+    """
+
+    def __init__(self, cache_dir: str, model: str, dimensions: int):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            cache_dir: Directory for the cache file (created if missing, "~" expanded)
+            model: Embedding model name (part of every key)
+            dimensions: Embedding dimensions (part of every key)
+        """
+        path = Path(cache_dir).expanduser()
+        path.mkdir(parents=True, exist_ok=True)
+        self.db_path = path / "embeddings.sqlite3"
+        self.model = model
+        self.dimensions = dimensions
+        self._key_prefix = f"{model}\0{dimensions}\0".encode("utf-8")
+
+        # Shared across threads — serialize access ourselves
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                key BLOB PRIMARY KEY,
+                vector BLOB NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+        logger.info("embedding_cache_opened", path=str(self.db_path), model=model, dimensions=dimensions)
+
+    def _key(self, text: str) -> bytes:
+        """Content address of an embedding input."""
+        return hashlib.blake2b(self._key_prefix + text.encode("utf-8"), digest_size=32).digest()
+
+    def get_many(self, texts: List[str]) -> Dict[str, List[float]]:
+        """
+        Look up cached vectors.
+
+        Returns:
+            {text: vector} for the hits only
+        """
+        keys = [self._key(text) for text in texts]
+        found: Dict[bytes, bytes] = {}
+
+        try:
+            with self._lock:
+                # Stay well under SQLite's bound-parameter limit
+                for start in range(0, len(keys), 500):
+                    batch = keys[start:start + 500]
+                    placeholders = ",".join("?" * len(batch))
+                    found.update(self._conn.execute(
+                        f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                        batch,
+                    ).fetchall())
+        except sqlite3.Error as e:
+            logger.warning("embedding_cache_read_failed", error=str(e))
+            return {}
+
+        hits = {}
+        for text, key in zip(texts, keys):
+            blob = found.get(key)
+            if blob is not None:
+                hits[text] = array("f", blob).tolist()
+        return hits
+
+    def put_many(self, texts: List[str], vectors: List[List[float]]) -> None:
+        """Store vectors computed for texts (best-effort)."""
+        rows = [
+            (self._key(text), array("f", vector).tobytes())
+            for text, vector in zip(texts, vectors)
+        ]
+
+        try:
+            with self._lock:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                    rows,
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            # Cache is best-effort — never fail an ingestion because of it
+            logger.warning("embedding_cache_write_failed", error=str(e))
@@ -0,0 +1,140 @@
+"""
+Ingestion Manifest - Fingerprint of each namespace's last successful ingestion.
+
+Re-running ingest_all re-loads, re-chunks and re-upserts every source even
+when nothing changed in Notion. A source tree's content is fully determined
+by its pages' last_edited_time values (a page's timestamp changes whenever
+any block inside it does), plus the settings that shape the vectors. Hashing
+those gives a fingerprint that can be compared against the last run before
+loading any content.
+
+The fingerprint covers:
+- (page_id, last_edited_time) of every page in the tree
+- include_nested / include_files
+- chunk_size / chunk_overlap / min_chunk_chars, embedding model and dimensions
+- vector ID scheme and file text extraction backends
+
+Storage is a single SQLite file (stdlib, safe across threads and processes).
+
+Usage:
+    from src.ingestion.ingestion_manifest import open_ingestion_manifest, source_fingerprint
+
+    manifest = open_ingestion_manifest(config)  # None if disabled
+    fingerprint = source_fingerprint(pages, settings)
+    if manifest.get(namespace) == fingerprint:
+        ...  # unchanged — skip
+    manifest.put(namespace, fingerprint)
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import structlog
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+from src.config import Config
+
+logger = structlog.get_logger(__name__)
+
+
+def source_fingerprint(pages: List[Dict[str, Any]], settings: Dict[str, Any]) -> str:
+    """
+    SHA-256 fingerprint of a source tree and the settings it was ingested with.
+
+    Args:
+        pages: NotionLoader.enumerate_pages() output
+        settings: Anything else that changes the stored vectors (JSON-serializable)
+    """
+    payload = {
+        "pages": sorted((page["page_id"], page["last_edited_time"]) for page in pages),
+        "settings": settings,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def open_ingestion_manifest(config: Config) -> Optional["IngestionManifest"]:
+    """
+    Open the manifest configured by config.ingestion_manifest_dir.
+
+    Returns None if it is disabled ("off") or can't be opened — every
+    ingestion then runs in full.
+    """
+    manifest_dir = config.ingestion_manifest_dir
+    if not manifest_dir or manifest_dir.lower() == "off":
+        return None
+
+    try:
+        return IngestionManifest(manifest_dir)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("ingestion_manifest_disabled", manifest_dir=manifest_dir, error=str(e))
+        return None
+
+
+class IngestionManifest:
+    """
+    SQLite-backed map of namespace → fingerprint of its last successful ingestion.
+    """
+
+    def __init__(self, cache_dir: str):
+        """
+        Open (or create) the manifest database.
+
+        Args:
+            cache_dir: Directory for the manifest file (created if missing, "~" expanded)
+        """
+        path = Path(cache_dir).expanduser()
+        path.mkdir(parents=True, exist_ok=True)
+        self.db_path = path / "ingestion_manifest.sqlite3"
+
+        # Shared by ingest_all's worker threads — serialize access ourselves
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS namespaces (
+                namespace TEXT PRIMARY KEY,
+                fingerprint TEXT NOT NULL,
+                ingested_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+        logger.info("ingestion_manifest_opened", path=str(self.db_path))
+
+    def get(self, namespace: str) -> Optional[str]:
+        """Fingerprint recorded for a namespace, or None."""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT fingerprint FROM namespaces WHERE namespace = ?",
+                    (namespace,),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("ingestion_manifest_read_failed", namespace=namespace, error=str(e))
+            return None
+        return row[0] if row else None
+
+    def put(self, namespace: str, fingerprint: str) -> None:
+        """Record a successful ingestion of a namespace."""
+        self._execute(
+            "INSERT OR REPLACE INTO namespaces (namespace, fingerprint, ingested_at) VALUES (?, ?, ?)",
+            (namespace, fingerprint, time.time()),
+            namespace,
+        )
+
+    def invalidate(self, namespace: str) -> None:
+        """Forget a namespace (its contents are about to change)."""
+        self._execute("DELETE FROM namespaces WHERE namespace = ?", (namespace,), namespace)
+
+    def _execute(self, sql: str, params: tuple, namespace: str) -> None:
+        try:
+            with self._lock:
+                self._conn.execute(sql, params)
+                self._conn.commit()
+        except sqlite3.Error as e:
+            # Manifest is best-effort — a lost entry only means a full re-ingest
+            logger.warning("ingestion_manifest_write_failed", namespace=namespace, error=str(e))
@@ -0,0 +1,177 @@
+"""
+Notion Block Cache - On-disk cache of page block lists, keyed by last_edited_time.
+
+Every sync walks the full Notion tree (enumerate_pages) and fetches every
+page's blocks just to find child pages — even when nothing changed. A page's
+last_edited_time changes whenever any block inside it changes (including
+nested blocks), so (page_id, last_edited_time) is a safe cache key for the
+page's flattened block list.
+
+Two Notion quirks make a naive cache wrong, so entries are only served when:
+- They were fetched at least one minute after last_edited_time. Notion rounds
+  last_edited_time to the minute, so an edit later in the same minute would
+  otherwise be invisible.
+- No Notion-hosted file URL in the blocks is about to expire. Those are
+  pre-signed S3 URLs valid for ~1 hour; serving them stale breaks PDF/DOCX
+  downloads.
+
+Storage is a single SQLite file (stdlib, safe across threads and processes).
+
+Usage:
+    from src.ingestion.notion_cache import NotionBlockCache
+
+    cache = NotionBlockCache("~/.cache/yamie/notion")
+    blocks = cache.get(page_id, last_edited_time)
+    if blocks is None:
+        blocks = fetch_blocks(page_id)
+        cache.put(page_id, last_edited_time, blocks)
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import structlog
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Optional
+
+logger = structlog.get_logger(__name__)
+
+
+# Notion timestamps have minute granularity
+EDIT_TIME_GRANULARITY_SECONDS = 60
+
+# Treat file URLs expiring within this window as already expired
+FILE_URL_EXPIRY_MARGIN_SECONDS = 10 * 60
+
+
+def _parse_notion_time(value: str) -> Optional[float]:
+    """Parse a Notion ISO timestamp (e.g. "2026-04-10T09:12:00.000Z") to epoch seconds."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except (ValueError, TypeError):
+        return None
+
+
+def _earliest_file_expiry(blocks: List[Dict]) -> Optional[float]:
+    """Earliest expiry_time of any Notion-hosted file URL in the blocks (None if there are none)."""
+    earliest = None
+    for block in blocks:
+        block_data = block.get(block.get("type", ""))
+        if not isinstance(block_data, dict):
+            continue
+        # "file" = Notion-hosted (expiring URL); "external" URLs don't expire
+        hosted_file = block_data.get("file")
+        if not hosted_file:
+            continue
+        expiry = _parse_notion_time(hosted_file.get("expiry_time", ""))
+        if expiry is not None and (earliest is None or expiry < earliest):
+            earliest = expiry
+    return earliest
+
+
+class NotionBlockCache:
+    """
+    SQLite-backed cache of Notion page blocks.
+
+    One row per page: (page_id, last_edited_time, fetched_at, urls_expire_at, blocks JSON).
+    A newer last_edited_time simply overwrites the row.
+    """
+
+    def __init__(self, cache_dir: str):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            cache_dir: Directory for the cache file (created if missing, "~" expanded)
+        """
+        path = Path(cache_dir).expanduser()
+        path.mkdir(parents=True, exist_ok=True)
+        self.db_path = path / "notion_blocks.sqlite3"
+
+        # Shared by the loader's worker threads — serialize access ourselves
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS page_blocks (
+                page_id TEXT PRIMARY KEY,
+                last_edited_time TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                urls_expire_at REAL,
+                blocks TEXT NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+        logger.info("notion_block_cache_opened", path=str(self.db_path))
+
+    def get(self, page_id: str, last_edited_time: str) -> Optional[List[Dict]]:
+        """
+        Return cached blocks for a page, or None on a miss / unusable entry.
+
+        Args:
+            page_id: Notion page ID
+            last_edited_time: The page's current last_edited_time (from the page object)
+        """
+        if not last_edited_time:
+            return None
+
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT last_edited_time, fetched_at, urls_expire_at, blocks "
+                    "FROM page_blocks WHERE page_id = ?",
+                    (page_id,),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("notion_block_cache_read_failed", page_id=page_id, error=str(e))
+            return None
+
+        if not row:
+            return None
+
+        cached_edit_time, fetched_at, urls_expire_at, blocks_json = row
+
+        if cached_edit_time != last_edited_time:
+            return None
+
+        # Fetched during the same (rounded) minute as the last edit → may be stale
+        edited_at = _parse_notion_time(last_edited_time)
+        if edited_at is None or fetched_at < edited_at + EDIT_TIME_GRANULARITY_SECONDS:
+            return None
+
+        # Pre-signed file URLs expired (or about to) → refetch for fresh URLs
+        if urls_expire_at is not None and urls_expire_at < time.time() + FILE_URL_EXPIRY_MARGIN_SECONDS:
+            return None
+
+        logger.debug("notion_block_cache_hit", page_id=page_id)
+        return json.loads(blocks_json)
+
+    def put(self, page_id: str, last_edited_time: str, blocks: List[Dict]) -> None:
+        """Store the blocks fetched for a page at its current last_edited_time."""
+        if not last_edited_time:
+            return
+
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO page_blocks "
+                    "(page_id, last_edited_time, fetched_at, urls_expire_at, blocks) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (
+                        page_id,
+                        last_edited_time,
+                        time.time(),
+                        _earliest_file_expiry(blocks),
+                        json.dumps(blocks),
+                    ),
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            # Cache is best-effort — never fail a load because of it
+            logger.warning("notion_block_cache_write_failed", page_id=page_id, error=str(e))
@@ -28,18 +28,31 @@ Usage:
     # }
 """
 
+import contextlib
+import io
+import multiprocessing
 import os
 import re
+import json
+import shutil
+import sqlite3
 import tempfile
+import threading
+import time
 import requests
 import structlog
-from typing import List, Dict, Optional, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import List, Dict, Optional, Any, Tuple, Iterator
 from datetime import datetime
 from urllib.parse import unquote
 
 from dotenv import load_dotenv
 from llama_index.core.schema import Document
 
+from src.ingestion.notion_cache import NotionBlockCache
+
 load_dotenv()
 
 logger = structlog.get_logger(__name__)
@@ -49,12 +62,19 @@ logger = structlog.get_logger(__name__)
 # FILE EXTRACTION SUPPORT
 # =============================================================================
 
-# Check for PDF support (using pypdf)
+# Check for PDF support - prefer pypdfium2 (PDFium, C engine, ~10x faster),
+# fall back to pypdf (pure Python) if it's not installed
 try:
-    import pypdf
-    PDF_SUPPORT = True
+    import pypdfium2 as pdfium
+    PDF_BACKEND = "pypdfium2"
 except ImportError:
-    PDF_SUPPORT = False
+    try:
+        import pypdf
+        PDF_BACKEND = "pypdf"
+    except ImportError:
+        PDF_BACKEND = None
+
+PDF_SUPPORT = PDF_BACKEND is not None
 
 # Check for DOCX support
 try:
@@ -63,6 +83,254 @@ try:
 except ImportError:
     DOCX_SUPPORT = False
 
+# Check for fast JSON parsing - prefer orjson (Rust, parses bytes directly),
+# then simdjson, falling back to the standard library json module
+try:
+    import orjson
+    JSON_BACKEND = "orjson"
+except ImportError:
+    try:
+        import simdjson
+        JSON_BACKEND = "simdjson"
+    except ImportError:
+        JSON_BACKEND = "json"
+
+
+# =============================================================================
+# JSON PARSING + TEXT STATS
+# =============================================================================
+
+# simdjson parsers reuse internal buffers and are not thread-safe → one per thread
+_json_parsers = threading.local()
+
+
+def _parse_json(content: bytes) -> Dict:
+    """
+    Parse a Notion API response body into plain Python dicts/lists.
+    
+    Uses orjson when installed (native parser, no intermediate str decode),
+    else simdjson (SIMD-accelerated, parser buffers reused across responses),
+    otherwise the standard library.
+    """
+    if JSON_BACKEND == "orjson":
+        return orjson.loads(content)
+    if JSON_BACKEND == "simdjson":
+        parser = getattr(_json_parsers, "parser", None)
+        if parser is None:
+            parser = _json_parsers.parser = simdjson.Parser()
+        # as_dict() materializes the document so the parser can safely be reused
+        return parser.parse(content).as_dict()
+    return json.loads(content)
+
+
+# Unicode-aware, so non-breaking spaces from Notion count as separators (like str.split)
+_WORD_PATTERN = re.compile(r"\S+")
+
+
+def _count_words(text: str) -> int:
+    """
+    Count whitespace-separated words without building a list of them.
+    
+    Same result as len(text.split()), but streams over the matches instead of
+    allocating one str per word — matters for multi-MB extracted PDFs.
+    """
+    return sum(1 for _ in _WORD_PATTERN.finditer(text))
+
+
+# =============================================================================
+# DOCUMENT METADATA
+# =============================================================================
+
+# Metadata left out of the text that gets embedded (still stored in Pinecone).
+# ingested_at changes every run — embedding it would make identical chunks
+# look different to the embedding cache and add noise to every vector.
+EMBED_EXCLUDED_METADATA_KEYS = ("ingested_at",)
+
+
+# =============================================================================
+# BLOCK FORMATTING
+# =============================================================================
+
+# Block type → formatter(text, block_data) used by _blocks_to_text, where
+# block_data is the type-specific payload (block[block["type"]]).
+# Built once at import; text block types not listed here are emitted as-is.
+_TEXT_FORMATTERS = {
+    "heading_1": lambda text, data: f"\n# {text}\n",
+    "heading_2": lambda text, data: f"\n## {text}\n",
+    "heading_3": lambda text, data: f"\n### {text}\n",
+    "bulleted_list_item": lambda text, data: f"• {text}",
+    "numbered_list_item": lambda text, data: f"• {text}",
+    "to_do": lambda text, data: f"{'☑' if data.get('checked', False) else '☐'} {text}",
+    "quote": lambda text, data: f"> {text}",
+    "code": lambda text, data: f"```{data.get('language', '')}\n{text}\n```",
+    "divider": lambda text, data: "\n---\n",
+}
+
+
+# =============================================================================
+# RATE LIMITING
+# =============================================================================
+
+class _RateLimiter:
+    """
+    Thread-safe token bucket: on average `rate` requests per second, with
+    bursts of up to `burst`.
+    
+    Callers that find the bucket empty reserve the next token (the count goes
+    negative) and sleep until it's due, so concurrent workers queue up fairly
+    instead of all waking at once and bursting past the limit.
+    """
+    
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> float:
+        """Take one token, sleeping if needed. Returns the seconds waited."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        
+        if wait:
+            time.sleep(wait)
+        return wait
+
+
+# =============================================================================
+# PDF EXTRACTION HELPERS
+# Module-level so they can run in worker processes (must be picklable).
+# =============================================================================
+
+# PDFs with at least this many pages are extracted across multiple processes
+PDF_PARALLEL_MIN_PAGES = 8
+# Capped: one pool is shared by every source ingesting at once
+PDF_WORKERS = min(4, os.cpu_count() or 1)
+
+_pdf_process_pool: Optional[ProcessPoolExecutor] = None
+_pdf_process_pool_lock = threading.Lock()
+# Ingestion runs currently using the pool (see retain_pdf_pool)
+_pdf_process_pool_users = 0
+
+
+def _get_pdf_process_pool() -> ProcessPoolExecutor:
+    """
+    Lazily create the shared PDF extraction process pool (one per process, reused across files).
+    
+    Workers are spawned, not forked: this process already runs threads (web
+    server, file extraction pool, log writer), and a forked child inherits
+    any lock one of them held at fork time — and can deadlock on it.
+    """
+    global _pdf_process_pool
+    with _pdf_process_pool_lock:
+        if _pdf_process_pool is None:
+            _pdf_process_pool = ProcessPoolExecutor(
+                max_workers=PDF_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pdf_process_pool
+
+
+def retain_pdf_pool():
+    """
+    Mark the start of an ingestion run that may extract PDFs.
+    
+    Pair with release_pdf_pool() in a finally block. Runs can overlap (sources
+    ingested concurrently, or ingest_page inside ingest_all), so the pool is
+    only shut down once the last of them releases it — otherwise its worker
+    processes would idle for the rest of a long-lived process (e.g. the
+    admin server).
+    """
+    global _pdf_process_pool_users
+    with _pdf_process_pool_lock:
+        _pdf_process_pool_users += 1
+
+
+def release_pdf_pool():
+    """
+    End an ingestion run started with retain_pdf_pool(); the last one shuts
+    the pool down (it's recreated lazily if needed again).
+    """
+    global _pdf_process_pool, _pdf_process_pool_users
+    with _pdf_process_pool_lock:
+        _pdf_process_pool_users -= 1
+        if _pdf_process_pool_users:
+            return
+        # Detached under the lock: a run starting now gets a fresh pool
+        pool, _pdf_process_pool = _pdf_process_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True)
+        logger.debug("pdf_process_pool_shutdown")
+
+
+# PDFium is not thread-safe: every call into it (open, page load, text
+# extraction, close) must hold this lock. pypdf is pure Python and needs none.
+_pdfium_lock = threading.Lock()
+
+
+def _pdf_lock():
+    """Lock to hold around all work on an open PDF (a no-op for pypdf)."""
+    if PDF_BACKEND == "pypdfium2":
+        return _pdfium_lock
+    return contextlib.nullcontext()
+
+
+def _open_pdf(source):
+    """Open a PDF (path, bytes or binary file object) with the active backend."""
+    if PDF_BACKEND == "pypdfium2":
+        return pdfium.PdfDocument(source)
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    return pypdf.PdfReader(source)
+
+
+def _close_pdf(pdf) -> None:
+    if PDF_BACKEND == "pypdfium2":
+        pdf.close()
+
+
+def _pdf_page_count(pdf) -> int:
+    if PDF_BACKEND == "pypdfium2":
+        return len(pdf)
+    return len(pdf.pages)
+
+
+def _pdf_page_range_texts(pdf, start: int, stop: int) -> List[str]:
+    """Extract non-empty page texts for pages [start, stop) of an open PDF."""
+    text_parts = []
+    
+    for index in range(start, stop):
+        if PDF_BACKEND == "pypdfium2":
+            page = pdf[index]
+            textpage = page.get_textpage()
+            page_text = textpage.get_text_bounded()
+            # Release PDFium page memory right away instead of at GC time
+            textpage.close()
+            page.close()
+        else:
+            page_text = pdf.pages[index].extract_text()
+        
+        if page_text:
+            text_parts.append(page_text)
+    
+    return text_parts
+
+
+def _extract_pdf_page_range(pdf_path: str, start: int, stop: int) -> List[str]:
+    """Worker entry point: open the PDF file in this process and extract one page range."""
+    with _pdf_lock():
+        pdf = _open_pdf(pdf_path)
+        try:
+            return _pdf_page_range_texts(pdf, start, stop)
+        finally:
+            _close_pdf(pdf)
+
 
 # =============================================================================
 # NOTION LOADER
@@ -105,12 +373,47 @@ class NotionLoader:
     # File extensions we can extract text from
     SUPPORTED_FILE_EXTENSIONS = {".pdf", ".docx"}
     
-    def __init__(self, api_key: str = None):
+    # Max embedded files downloaded/extracted in parallel per page.
+    # Downloads hit pre-signed S3 URLs, not the rate-limited Notion API.
+    MAX_FILE_WORKERS = 8
+    
+    # Max concurrent Notion API requests when fetching nested blocks.
+    # Notion allows ~3 requests/second on average per integration.
+    MAX_API_WORKERS = 3
+    
+    # Client-side request budget (token bucket) shared by all worker threads,
+    # so fast responses can't push the crawl past Notion's limit into 429s
+    API_REQUESTS_PER_SECOND = 3
+    API_BURST = 3
+    
+    # Keep-alive connections per host (must cover MAX_FILE_WORKERS concurrent downloads)
+    HTTP_POOL_SIZE = 10
+    
+    # Default location of the on-disk block cache (override with NOTION_CACHE_DIR)
+    DEFAULT_CACHE_DIR = "~/.cache/yamie/notion"
+    
+    # Embedded file downloads are buffered in memory up to this size, then spill to disk
+    FILE_SPOOL_MAX_BYTES = 16 * 1024 * 1024
+    # Large read size keeps the per-chunk Python loop cheap on multi-MB files
+    DOWNLOAD_CHUNK_BYTES = 1024 * 1024
+    
+    def __init__(
+        self,
+        api_key: str = None,
+        cache_dir: Optional[str] = None,
+        rate_limiter: Optional[_RateLimiter] = None,
+    ):
         """
         Initialize the Notion loader.
         
         Args:
             api_key: Notion API key. Reads from NOTION_API_KEY env var if not provided.
+            cache_dir: Directory for the on-disk block cache. Reads from NOTION_CACHE_DIR
+                       env var if not provided (default: ~/.cache/yamie/notion).
+                       Set NOTION_CACHE_DIR=off to disable caching.
+            rate_limiter: Request budget to share with other loaders using the same
+                          integration (pass another loader's .rate_limiter). A new
+                          one is created if not provided.
         """
         self.api_key = api_key or os.getenv("NOTION_API_KEY")
         
@@ -126,15 +429,69 @@ class NotionLoader:
             "Notion-Version": self.NOTION_VERSION
         }
         
+        # One pooled session for the whole crawl: keep-alive reuses the TCP+TLS
+        # connection instead of handshaking for every API call / file download.
+        # Auth headers are passed per API request, NOT set on the session —
+        # file downloads go to pre-signed S3 URLs that reject extra auth headers.
+        self._session = requests.Session()
+        # Transient failures (rate limits, gateway errors) are retried at the
+        # connection-pool level with exponential backoff plus jitter (so the
+        # worker threads don't retry in lockstep). urllib3 honors the
+        # Retry-After header Notion sends with 429 responses.
+        retry_policy = Retry(
+            total=5,
+            backoff_factor=0.5,
+            backoff_jitter=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({"GET", "POST"}),  # POST /search is read-only
+            raise_on_status=False,  # Return the last response so _api_request logs it
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.HTTP_POOL_SIZE,
+            pool_maxsize=self.HTTP_POOL_SIZE,
+            max_retries=retry_policy,
+        )
+        self._session.mount("https://", adapter)
+        
+        # Every Notion API call takes a token first (file downloads don't — S3).
+        # Notion's limit is per integration, so concurrent loaders share one.
+        self.rate_limiter = rate_limiter or _RateLimiter(self.API_REQUESTS_PER_SECOND, self.API_BURST)
+        
+        # Time this loader spent waiting on the rate limiter (read by the pipeline)
+        self.rate_limit_waits = 0
+        self.rate_limit_wait_seconds = 0.0
+        # Loads that dropped content: failed API requests (which also leave
+        # block trees incomplete) and failed file extractions. The pipeline
+        # compares before/after a run — any increase means partial content.
+        self.load_failures = 0
+        self._stats_lock = threading.Lock()
+        
+        # On-disk block cache (best-effort: loader works without it)
+        cache_dir = cache_dir or os.getenv("NOTION_CACHE_DIR") or self.DEFAULT_CACHE_DIR
+        self._block_cache = None
+        if cache_dir.lower() != "off":
+            try:
+                self._block_cache = NotionBlockCache(cache_dir)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning("notion_block_cache_disabled", cache_dir=cache_dir, error=str(e))
+        
+        # Per-run memo of fetched pages/blocks. A sync enumerates the whole tree
+        # and then reloads the changed pages, so without it every changed page
+        # is fetched twice. Reset at the start of each tree walk.
+        self._page_memo: Dict[str, Dict] = {}
+        self._blocks_memo: Dict[str, Tuple[str, List[Dict]]] = {}
+        
         # Log initialization with file support status
         logger.info(
             "notion_loader_initialized",
             pdf_support=PDF_SUPPORT,
-            docx_support=DOCX_SUPPORT
+            pdf_backend=PDF_BACKEND,
+            docx_support=DOCX_SUPPORT,
+            json_backend=JSON_BACKEND
         )
         
         if not PDF_SUPPORT:
-            logger.warning("pdf_support_disabled", reason="pypdf not installed - run: pip install pypdf")
+            logger.warning("pdf_support_disabled", reason="pypdfium2/pypdf not installed - run: pip install pypdfium2")
         if not DOCX_SUPPORT:
             logger.warning("docx_support_disabled", reason="docx2txt not installed")
     
@@ -168,6 +525,40 @@ class NotionLoader:
                 namespace="operations-department"
             )
         """
+        return list(self.iter_documents(
+            page_id=page_id,
+            namespace=namespace,
+            include_nested_pages=include_nested_pages,
+            include_files=include_files,
+        ))
+    
+    def iter_documents(
+        self,
+        page_id: str,
+        namespace: str,
+        include_nested_pages: bool = True,
+        include_files: bool = True,
+        reset_memo: bool = True,
+    ) -> Iterator[Document]:
+        """
+        Stream all content from a Notion page and its children, page by page.
+        
+        Same documents, in the same order, as load_from_page — but yielded as
+        each page is loaded, so a consumer that processes documents one at a
+        time (e.g. the chunker) never holds the whole tree's text in memory.
+        
+        Args:
+            page_id: The root Notion page ID to load from
+            namespace: Namespace identifier for Pinecone (e.g., "operations-department")
+            include_nested_pages: Whether to recursively load child pages (default: True)
+            include_files: Whether to extract embedded PDF/DOCX files (default: True)
+            reset_memo: Forget pages/blocks memoized earlier (default: True). Pass
+                False right after enumerate_pages on the same root to reuse what
+                that walk already fetched instead of fetching it again.
+            
+        Yields:
+            LlamaIndex Document objects, each with full source path metadata
+        """
         logger.info(
             "load_started",
             page_id=page_id,
@@ -176,39 +567,45 @@ class NotionLoader:
             include_files=include_files
         )
         
-        documents = []
+        if reset_memo:
+            self._reset_run_memo()
         
         # Get root page info to start the path
         root_page = self._fetch_page(page_id)
         if not root_page:
             logger.error("root_page_not_found", page_id=page_id)
-            return documents
+            return
         
         root_title = self._extract_page_title(root_page)
         
-        # Recursively load all content
-        self._load_page_recursive(
+        # Load the whole page tree, tallying the summary as documents pass through
+        page_count = 0
+        file_count = 0
+        total_count = 0
+        
+        for doc in self._load_page_tree(
             page_id=page_id,
             namespace=namespace,
             parent_path=root_title,
-            documents=documents,
             include_nested_pages=include_nested_pages,
-            include_files=include_files
-        )
-        
-        # Log summary
-        page_count = sum(1 for d in documents if d.metadata.get("source_type") == "notion_page")
-        file_count = sum(1 for d in documents if "embedded" in d.metadata.get("source_type", ""))
+            include_files=include_files,
+            page_info=root_page,
+        ):
+            source_type = doc.metadata.get("source_type", "")
+            total_count += 1
+            if source_type == "notion_page":
+                page_count += 1
+            elif "embedded" in source_type:
+                file_count += 1
+            yield doc
         
         logger.info(
             "load_completed",
             namespace=namespace,
-            total_documents=len(documents),
+            total_documents=total_count,
             pages=page_count,
             embedded_files=file_count
         )
-        
-        return documents
     
     def search_accessible_pages(self) -> List[Dict[str, str]]:
         """
@@ -253,34 +650,43 @@ class NotionLoader:
         
         Args:
             page_id: Root page ID to start from
-            parent_path: Path prefix (used internally for recursion)
+            parent_path: Path prefix for the root page's path (default: none)
             
         Returns:
             List of dicts: {"page_id", "title", "last_edited_time", "parent_path"}
         """
-        page_info = self._fetch_page(page_id)
-        if not page_info:
-            return []
-        
-        title = self._extract_page_title(page_info)
-        current_path = f"{parent_path}/{title}" if parent_path else title
-        last_edited = page_info.get("last_edited_time", "")
-        
-        pages = [{
-            "page_id": page_id,
-            "title": title,
-            "last_edited_time": last_edited,
-            "parent_path": current_path,
-        }]
+        pages = []
+        self._reset_run_memo()
         
-        # Fetch child blocks to find child_page blocks (lightweight - no content extraction)
-        blocks = self._fetch_all_blocks(page_id)
-        child_pages = [b for b in blocks if b.get("type") == "child_page"]
+        # Explicit depth-first worklist (no Python recursion — deep trees can't
+        # hit RecursionError). Children are pushed in reverse so they're visited
+        # in Notion order, giving the same output order as a recursive walk.
+        stack = [(page_id, parent_path)]
         
-        for child_block in child_pages:
-            child_id = child_block["id"]
-            child_pages_result = self.enumerate_pages(child_id, current_path)
-            pages.extend(child_pages_result)
+        while stack:
+            current_id, path_prefix = stack.pop()
+            
+            page_info = self._fetch_page(current_id)
+            if not page_info:
+                continue
+            
+            title = self._extract_page_title(page_info)
+            current_path = f"{path_prefix}/{title}" if path_prefix else title
+            last_edited = page_info.get("last_edited_time", "")
+            
+            pages.append({
+                "page_id": current_id,
+                "title": title,
+                "last_edited_time": last_edited,
+                "parent_path": current_path,
+            })
+            
+            # Fetch child blocks to find child_page blocks (lightweight - no content extraction)
+            blocks = self._fetch_page_blocks(current_id, page_info)
+            child_pages = [b for b in blocks if b.get("type") == "child_page"]
+            
+            for child_block in reversed(child_pages):
+                stack.append((child_block["id"], current_path))
         
         return pages
     
@@ -315,14 +721,15 @@ class NotionLoader:
         
         page_title = self._extract_page_title(page_info)
         page_url = page_info.get("url", "")
+        ingested_at = datetime.utcnow().isoformat()
         
         # Fetch all blocks
-        blocks = self._fetch_all_blocks(page_id)
+        blocks = self._fetch_page_blocks(page_id, page_info)
         
         # Extract text content
         text_content = self._blocks_to_text(blocks)
         
-        if text_content and text_content.strip():
+        if text_content and not text_content.isspace():
             doc = Document(
                 text=text_content,
                 metadata={
@@ -335,9 +742,10 @@ class NotionLoader:
                     "page_url": page_url,
                     "file_name": page_title,
                     "char_count": len(text_content),
-                    "word_count": len(text_content.split()),
-                    "ingested_at": datetime.utcnow().isoformat(),
-                }
+                    "word_count": _count_words(text_content),
+                    "ingested_at": ingested_at,
+                },
+                excluded_embed_metadata_keys=list(EMBED_EXCLUDED_METADATA_KEYS),
             )
             documents.append(doc)
         
@@ -347,7 +755,8 @@ class NotionLoader:
                 blocks=blocks,
                 namespace=namespace,
                 parent_path=parent_path,
-                page_id=page_id
+                page_id=page_id,
+                ingested_at=ingested_at,
             )
             documents.extend(file_docs)
         
@@ -361,47 +770,111 @@ class NotionLoader:
         return documents
     
     # =========================================================================
-    # RECURSIVE LOADING
+    # TREE LOADING
     # =========================================================================
     
-    def _load_page_recursive(
+    def _load_page_tree(
         self,
         page_id: str,
         namespace: str,
         parent_path: str,
-        documents: List[Document],
         include_nested_pages: bool,
         include_files: bool,
-    ):
+        page_info: Optional[Dict] = None,
+        ingested_at: Optional[str] = None,
+    ) -> Iterator[Document]:
         """
-        Recursively load a page and all its descendants.
+        Load a page and all its descendants (depth-first, iterative), yielding
+        each page's documents as soon as that page is loaded.
+        
+        Uses an explicit stack instead of Python recursion, so deep page trees
+        can't hit RecursionError. Documents come out in the same order as a
+        recursive walk: a page's own documents, then each child subtree in turn.
+        
+        Each child page is fetched as a page object (GET /pages): its
+        last_edited_time keys the block cache, and a child_page block from a
+        cached parent would carry a stale one.
         
         Args:
-            page_id: Current page to load
+            page_id: Root page to load
+            namespace: Pinecone namespace
+            parent_path: Path of the root page (e.g., "Operations Department")
+            include_nested_pages: Whether to descend into child pages
+            include_files: Whether to extract embedded files
+            page_info: Root page object if the caller already fetched it
+            ingested_at: Timestamp stamped on every document (default: now)
+        """
+        # One timestamp for the whole load, not one per document
+        ingested_at = ingested_at or datetime.utcnow().isoformat()
+        stack = [(page_id, parent_path, page_info)]
+        
+        while stack:
+            current_id, current_path, current_info = stack.pop()
+            
+            page_documents = []
+            child_pages = self._load_page(
+                page_id=current_id,
+                namespace=namespace,
+                parent_path=current_path,
+                documents=page_documents,
+                include_files=include_files,
+                page_info=current_info,
+                ingested_at=ingested_at,
+            )
+            yield from page_documents
+            
+            if include_nested_pages:
+                # Reverse so children pop off the stack in Notion order
+                for child_block in reversed(child_pages):
+                    child_title = child_block.get("child_page", {}).get("title", "Untitled")
+                    stack.append((child_block["id"], f"{current_path}/{child_title}", None))
+    
+    def _load_page(
+        self,
+        page_id: str,
+        namespace: str,
+        parent_path: str,
+        documents: List[Document],
+        include_files: bool,
+        page_info: Optional[Dict] = None,
+        ingested_at: Optional[str] = None,
+    ) -> List[Dict]:
+        """
+        Load one page's text and embedded files into documents.
+        
+        Args:
+            page_id: Page to load
             namespace: Pinecone namespace
             parent_path: Path from root to this page (e.g., "Operations Department/Weekly reports")
             documents: List to append documents to
-            include_nested_pages: Whether to recurse into child pages
             include_files: Whether to extract embedded files
+            page_info: Page object (fetched if not given)
+            ingested_at: Timestamp stamped on the documents (default: now)
+            
+        Returns:
+            The page's child_page blocks (for the caller to descend into)
         """
         logger.debug("loading_page", page_id=page_id, path=parent_path)
         
         # Fetch page metadata
-        page_info = self._fetch_page(page_id)
-        if not page_info:
-            return
+        if page_info is None:
+            page_info = self._fetch_page(page_id)
+            if not page_info:
+                return []
         
         page_title = self._extract_page_title(page_info)
         page_url = page_info.get("url", "")
+        ingested_at = ingested_at or datetime.utcnow().isoformat()
         
         # Fetch all blocks (with recursive child blocks for nested bullets etc.)
-        blocks = self._fetch_all_blocks(page_id)
+        blocks = self._fetch_page_blocks(page_id, page_info)
         
         # Extract text content from blocks
         text_content = self._blocks_to_text(blocks)
         
-        # Create document for page text if there's content
-        if text_content and text_content.strip():
+        # Create document for page text if there's content (isspace() checks without
+        # copying the string the way strip() does)
+        if text_content and not text_content.isspace():
             doc = Document(
                 text=text_content,
                 metadata={
@@ -421,9 +894,10 @@ class NotionLoader:
                     
                     # Stats
                     "char_count": len(text_content),
-                    "word_count": len(text_content.split()),
-                    "ingested_at": datetime.utcnow().isoformat(),
-                }
+                    "word_count": _count_words(text_content),
+                    "ingested_at": ingested_at,
+                },
+                excluded_embed_metadata_keys=list(EMBED_EXCLUDED_METADATA_KEYS),
             )
             documents.append(doc)
             
@@ -439,27 +913,12 @@ class NotionLoader:
                 blocks=blocks,
                 namespace=namespace,
                 parent_path=parent_path,
-                page_id=page_id
+                page_id=page_id,
+                ingested_at=ingested_at,
             )
             documents.extend(file_docs)
         
-        # Recurse into child pages
-        if include_nested_pages:
-            child_pages = [b for b in blocks if b.get("type") == "child_page"]
-            
-            for child_block in child_pages:
-                child_id = child_block["id"]
-                child_title = child_block.get("child_page", {}).get("title", "Untitled")
-                child_path = f"{parent_path}/{child_title}"
-                
-                self._load_page_recursive(
-                    page_id=child_id,
-                    namespace=namespace,
-                    parent_path=child_path,
-                    documents=documents,
-                    include_nested_pages=include_nested_pages,
-                    include_files=include_files
-                )
+        return [b for b in blocks if b.get("type") == "child_page"]
     
     # =========================================================================
     # NOTION API HELPERS
@@ -474,8 +933,14 @@ class NotionLoader:
         """Make a request to the Notion API."""
         url = f"{self.BASE_URL}{endpoint}"
         
+        waited = self.rate_limiter.acquire()
+        if waited:
+            with self._stats_lock:
+                self.rate_limit_waits += 1
+                self.rate_limit_wait_seconds += waited
+        
         try:
-            response = requests.request(
+            response = self._session.request(
                 method=method,
                 url=url,
                 headers=self.headers,
@@ -484,7 +949,7 @@ class NotionLoader:
             )
             
             if response.status_code == 200:
-                return response.json()
+                return _parse_json(response.content)
             else:
                 logger.error(
                     "api_request_failed",
@@ -492,27 +957,129 @@ class NotionLoader:
                     status=response.status_code,
                     error=response.text[:200]
                 )
+                self._record_load_failure()
                 return None
                 
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
+            # ValueError: malformed JSON body (orjson.JSONDecodeError subclasses it too)
             logger.error("api_request_error", endpoint=endpoint, error=str(e))
+            self._record_load_failure()
             return None
     
+    def _record_load_failure(self):
+        """Count a load that dropped content (see load_failures)."""
+        with self._stats_lock:
+            self.load_failures += 1
+    
     def _fetch_page(self, page_id: str) -> Optional[Dict]:
-        """Fetch page metadata."""
-        return self._api_request("GET", f"/pages/{page_id}")
+        """Fetch page metadata (memoized for the current run)."""
+        page = self._page_memo.get(page_id)
+        if page is None:
+            page = self._api_request("GET", f"/pages/{page_id}")
+            if page:
+                self._page_memo[page_id] = page
+        return page
+    
+    def _reset_run_memo(self):
+        """Forget pages/blocks fetched by a previous run so a new walk sees fresh data."""
+        self._page_memo.clear()
+        self._blocks_memo.clear()
+    
+    def _fetch_page_blocks(self, page_id: str, page_info: Dict) -> List[Dict]:
+        """
+        Fetch all blocks of a page, served from the block cache when the page
+        hasn't been edited since it was cached (see notion_cache.py).
+        """
+        last_edited = page_info.get("last_edited_time", "")
+        
+        memo = self._blocks_memo.get(page_id)
+        if memo and memo[0] == last_edited:
+            return memo[1]
+        
+        if self._block_cache:
+            cached = self._block_cache.get(page_id, last_edited)
+            if cached is not None:
+                self._blocks_memo[page_id] = (last_edited, cached)
+                return cached
+        
+        blocks, complete = self._fetch_block_tree(page_id)
+        
+        # Never cache a partial tree (a request failed mid-walk)
+        if complete:
+            self._blocks_memo[page_id] = (last_edited, blocks)
+            if self._block_cache:
+                self._block_cache.put(page_id, last_edited, blocks)
+        
+        return blocks
     
     def _fetch_all_blocks(self, block_id: str) -> List[Dict]:
         """
         Fetch all blocks from a page/block, including nested children.
+        See _fetch_block_tree.
+        """
+        return self._fetch_block_tree(block_id)[0]
+    
+    def _fetch_block_tree(self, block_id: str) -> Tuple[List[Dict], bool]:
+        """
+        Fetch all blocks from a page/block, including nested children.
         
         Handles:
         - Pagination (pages with 100+ blocks)
         - Nested blocks (sub-bullets, toggle contents, etc.)
+        
+        Nested blocks are fetched concurrently (bounded by MAX_API_WORKERS):
+        each block's children are requested as soon as the block itself is
+        seen, so workers never sit idle waiting for a whole depth level to
+        finish. The result is flattened in the same depth-first order as a
+        serial walk (parent, then its children).
+        
+        Returns:
+            (blocks, complete) — complete is False if any API request failed
         """
+        root_blocks, complete = self._fetch_block_children(block_id)
+        children_by_parent = {block_id: root_blocks}
+        nested_ids = [b["id"] for b in root_blocks if self._has_nested_blocks(b)]
+        
+        if nested_ids:
+            with ThreadPoolExecutor(max_workers=self.MAX_API_WORKERS) as executor:
+                pending = {
+                    executor.submit(self._fetch_block_children, nested_id): nested_id
+                    for nested_id in nested_ids
+                }
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        parent_id = pending.pop(future)
+                        blocks, fetch_complete = future.result()
+                        complete = complete and fetch_complete
+                        children_by_parent[parent_id] = blocks
+                        for block in blocks:
+                            if self._has_nested_blocks(block):
+                                pending[executor.submit(self._fetch_block_children, block["id"])] = block["id"]
+        
+        # Flatten depth-first: each block is followed by its nested blocks
         all_blocks = []
+        stack = [iter(children_by_parent[block_id])]
+        while stack:
+            block = next(stack[-1], None)
+            if block is None:
+                stack.pop()
+                continue
+            all_blocks.append(block)
+            nested = children_by_parent.get(block["id"])
+            if nested:
+                stack.append(iter(nested))
+        
+        return all_blocks, complete
+    
+    def _fetch_block_children(self, block_id: str) -> Tuple[List[Dict], bool]:
+        """
+        Fetch the direct children of a page/block (all pagination pages, no nesting).
         
-        # Fetch direct children (with pagination)
+        Returns:
+            (blocks, complete) — complete is False if a request failed
+        """
+        blocks = []
         params = {"page_size": 100}
         
         while True:
@@ -523,24 +1090,19 @@ class NotionLoader:
             )
             
             if not response:
-                break
-            
-            blocks = response.get("results", [])
+                return blocks, False
             
-            for block in blocks:
-                all_blocks.append(block)
-                
-                # Recursively fetch nested blocks (but not child_page - those are separate)
-                if block.get("has_children") and block.get("type") != "child_page":
-                    nested = self._fetch_all_blocks(block["id"])
-                    all_blocks.extend(nested)
+            blocks.extend(response.get("results", []))
             
             if response.get("has_more"):
                 params["start_cursor"] = response["next_cursor"]
             else:
-                break
-        
-        return all_blocks
+                return blocks, True
+    
+    @staticmethod
+    def _has_nested_blocks(block: Dict) -> bool:
+        """Nested content to inline (child pages are loaded separately, not inlined)."""
+        return bool(block.get("has_children")) and block.get("type") != "child_page"
     
     def _extract_page_title(self, page: Dict) -> str:
         """Extract title from a page object."""
@@ -575,54 +1137,38 @@ class NotionLoader:
         lines = []
         
         for block in blocks:
+            # Look up the type and its payload once per block
             block_type = block.get("type", "")
+            block_data = block.get(block_type)
+            if block_data is None:
+                continue
             
             if block_type in self.TEXT_BLOCK_TYPES:
-                text = self._extract_block_text(block)
+                text = self._extract_block_text(block_data)
                 
                 if text:
-                    # Apply formatting based on block type
-                    if block_type == "heading_1":
-                        text = f"\n# {text}\n"
-                    elif block_type == "heading_2":
-                        text = f"\n## {text}\n"
-                    elif block_type == "heading_3":
-                        text = f"\n### {text}\n"
-                    elif block_type in ("bulleted_list_item", "numbered_list_item"):
-                        text = f"• {text}"
-                    elif block_type == "to_do":
-                        checked = block.get("to_do", {}).get("checked", False)
-                        text = f"{'☑' if checked else '☐'} {text}"
-                    elif block_type == "quote":
-                        text = f"> {text}"
-                    elif block_type == "code":
-                        lang = block.get("code", {}).get("language", "")
-                        text = f"```{lang}\n{text}\n```"
-                    elif block_type == "divider":
-                        text = "\n---\n"
-                    
-                    lines.append(text)
+                    # Apply formatting based on block type (plain text if no formatter)
+                    formatter = _TEXT_FORMATTERS.get(block_type)
+                    lines.append(formatter(text, block_data) if formatter else text)
             
             # Note child pages (they're loaded separately)
             elif block_type == "child_page":
-                title = block.get("child_page", {}).get("title", "Untitled")
-                lines.append(f"\n[See: {title}]\n")
+                lines.append(f"\n[See: {block_data.get('title', 'Untitled')}]\n")
             
             # Note databases
             elif block_type == "child_database":
-                title = block.get("child_database", {}).get("title", "Untitled")
-                lines.append(f"\n[Database: {title}]\n")
+                lines.append(f"\n[Database: {block_data.get('title', 'Untitled')}]\n")
         
         return "\n".join(lines)
     
-    def _extract_block_text(self, block: Dict) -> str:
-        """Extract plain text from a single block."""
-        block_type = block.get("type", "")
-        block_data = block.get(block_type, {})
-        
-        # Most text blocks have rich_text
-        rich_text = block_data.get("rich_text", [])
-        return "".join(item.get("plain_text", "") for item in rich_text)
+    def _extract_block_text(self, block_data: Dict) -> str:
+        """Extract plain text from a block's type-specific payload (block[block["type"]])."""
+        # Most text blocks have rich_text.
+        # join() materializes its input anyway — a list comprehension skips the generator overhead.
+        rich_text = block_data.get("rich_text")
+        if not rich_text:
+            return ""
+        return "".join([item.get("plain_text", "") for item in rich_text])
     
     # =========================================================================
     # FILE EXTRACTION
@@ -633,12 +1179,17 @@ class NotionLoader:
         blocks: List[Dict],
         namespace: str,
         parent_path: str,
-        page_id: str = ""
+        page_id: str = "",
+        ingested_at: Optional[str] = None,
     ) -> List[Document]:
         """
         Extract text from embedded PDF and DOCX files.
+        
+        Files are downloaded and extracted concurrently in a small thread pool
+        (bounded by MAX_FILE_WORKERS) so slow downloads don't serialize.
         """
-        documents = []
+        # First pass: collect the files we can extract (cheap, no I/O)
+        file_jobs = []
         
         for block in blocks:
             block_type = block.get("type", "")
@@ -646,7 +1197,9 @@ class NotionLoader:
             if block_type not in self.FILE_BLOCK_TYPES:
                 continue
             
-            block_data = block.get(block_type, {})
+            block_data = block.get(block_type)
+            if not block_data:
+                continue
             
             # Get file URL (internal Notion file or external)
             file_info = block_data.get("file") or block_data.get("external")
@@ -666,17 +1219,26 @@ class NotionLoader:
                 logger.debug("skipping_unsupported_file", file=file_name, ext=file_ext)
                 continue
             
-            logger.info("extracting_file", file=file_name, path=parent_path)
-            
-            # Extract text
-            file_text = None
-            
-            if file_ext == ".pdf":
-                file_text = self._extract_pdf(file_url)
-            elif file_ext == ".docx":
-                file_text = self._extract_docx(file_url)
-            
-            if file_text and file_text.strip():
+            file_jobs.append((file_name, file_ext, file_url))
+        
+        if not file_jobs:
+            return []
+        
+        # Second pass: download + extract concurrently.
+        # Each file is dominated by network/disk wait, so threads overlap the waits.
+        # executor.map preserves input order, keeping document order deterministic.
+        workers = min(self.MAX_FILE_WORKERS, len(file_jobs))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            file_texts = list(executor.map(
+                lambda job: self._extract_file(job[0], job[1], job[2], parent_path),
+                file_jobs,
+            ))
+        
+        documents = []
+        ingested_at = ingested_at or datetime.utcnow().isoformat()
+        
+        for (file_name, file_ext, _), file_text in zip(file_jobs, file_texts):
+            if file_text and not file_text.isspace():
                 # Build full path including the file
                 full_path = f"{parent_path}/{file_name}"
                 
@@ -695,9 +1257,10 @@ class NotionLoader:
                         
                         # Stats
                         "char_count": len(file_text),
-                        "word_count": len(file_text.split()),
-                        "ingested_at": datetime.utcnow().isoformat(),
-                    }
+                        "word_count": _count_words(file_text),
+                        "ingested_at": ingested_at,
+                    },
+                    excluded_embed_metadata_keys=list(EMBED_EXCLUDED_METADATA_KEYS),
                 )
                 documents.append(doc)
                 
@@ -712,75 +1275,128 @@ class NotionLoader:
         
         return documents
     
+    def _extract_file(self, file_name: str, file_ext: str, file_url: str, parent_path: str) -> Optional[str]:
+        """Download and extract text from a single embedded file (runs in a worker thread)."""
+        logger.info("extracting_file", file=file_name, path=parent_path)
+        
+        if file_ext == ".pdf":
+            return self._extract_pdf(file_url)
+        elif file_ext == ".docx":
+            return self._extract_docx(file_url)
+        return None
+    
+    def _download_file(self, url: str) -> tempfile.SpooledTemporaryFile:
+        """
+        Stream a file download into a spooled buffer.
+        
+        Small files stay in memory; anything above FILE_SPOOL_MAX_BYTES spills
+        to a temp file automatically. Avoids the write-to-disk + re-read round
+        trip for the typical embedded PDF/DOCX. Caller must close the buffer.
+        """
+        buffer = tempfile.SpooledTemporaryFile(max_size=self.FILE_SPOOL_MAX_BYTES)
+        try:
+            with self._session.get(url, stream=True, timeout=60) as response:
+                response.raise_for_status()
+                for chunk in response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_BYTES):
+                    buffer.write(chunk)
+            buffer.seek(0)
+            return buffer
+        except Exception:
+            buffer.close()
+            raise
+    
     def _extract_pdf(self, url: str) -> Optional[str]:
         """Download and extract text from a PDF."""
         if not PDF_SUPPORT:
             return None
         
         try:
-            # Download
-            response = requests.get(url, timeout=60)
-            response.raise_for_status()
-            
-            # Save to temp file
-            with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-                f.write(response.content)
-                temp_path = f.name
-            
-            # Extract text using pypdf
-            text_parts = []
-            reader = pypdf.PdfReader(temp_path)
-            
-            for page in reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text_parts.append(page_text)
-            
-            # Cleanup
-            os.unlink(temp_path)
+            with self._download_file(url) as buffer:
+                text_parts = self._pdf_page_texts(buffer)
             
             return "\n\n".join(text_parts)
             
         except Exception as e:
             logger.error("pdf_extraction_error", error=str(e))
+            self._record_load_failure()
             return None
     
+    def _pdf_page_texts(self, source) -> List[str]:
+        """
+        Extract non-empty text per page from a PDF (path or binary file object).
+        
+        Small PDFs are extracted inline. PDFs with PDF_PARALLEL_MIN_PAGES or more
+        pages are split into page ranges and decoded in the shared process pool,
+        so text extraction isn't bound to one core by the GIL.
+        
+        Inline extraction holds the PDFium lock: this runs on the file
+        extraction threads, and concurrent PDFium calls crash the process.
+        """
+        with _pdf_lock():
+            pdf = _open_pdf(source)
+            try:
+                page_count = _pdf_page_count(pdf)
+                if page_count < PDF_PARALLEL_MIN_PAGES or PDF_WORKERS == 1:
+                    return _pdf_page_range_texts(pdf, 0, page_count)
+            finally:
+                _close_pdf(pdf)
+        
+        # Workers open the PDF from disk: only its path is sent per page range,
+        # never the file's bytes (file objects don't pickle anyway)
+        if not hasattr(source, "read"):
+            return self._pdf_page_texts_parallel(source, page_count)
+        
+        source.seek(0)
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as pdf_file:
+            shutil.copyfileobj(source, pdf_file)
+        try:
+            return self._pdf_page_texts_parallel(pdf_file.name, page_count)
+        finally:
+            os.unlink(pdf_file.name)
+    
+    def _pdf_page_texts_parallel(self, pdf_path: str, page_count: int) -> List[str]:
+        """Extract a PDF file's page texts in page ranges across the shared process pool."""
+        executor = _get_pdf_process_pool()
+        range_size = -(-page_count // PDF_WORKERS)  # ceil division
+        futures = [
+            executor.submit(_extract_pdf_page_range, pdf_path, start, min(start + range_size, page_count))
+            for start in range(0, page_count, range_size)
+        ]
+        
+        # Collect in submission order so pages stay in document order
+        text_parts = []
+        for future in futures:
+            text_parts.extend(future.result())
+        
+        logger.debug("pdf_extracted_parallel", pages=page_count, ranges=len(futures))
+        return text_parts
+    
     def _extract_docx(self, url: str) -> Optional[str]:
         """Download and extract text from a DOCX."""
         if not DOCX_SUPPORT:
             return None
         
         try:
-            # Download
-            response = requests.get(url, timeout=60)
-            response.raise_for_status()
-            
-            # Save to temp file
-            with tempfile.NamedTemporaryFile(suffix=".docx", delete=False) as f:
-                f.write(response.content)
-                temp_path = f.name
-            
-            # Extract text
-            text = docx2txt.process(temp_path)
-            
-            # Cleanup
-            os.unlink(temp_path)
-            
-            return text
+            # docx2txt opens the file with zipfile, which accepts file objects
+            with self._download_file(url) as buffer:
+                return docx2txt.process(buffer)
             
         except Exception as e:
             logger.error("docx_extraction_error", error=str(e))
+            self._record_load_failure()
             return None
     
     def _filename_from_url(self, url: str) -> str:
         """Extract filename from URL."""
         # Remove query params
-        path = url.split("?")[0]
+        path = url.partition("?")[0]
         
-        # Get last path segment
-        segments = path.split("/")
-        for segment in reversed(segments):
+        # Walk segments from the end (no intermediate list of all segments)
+        while path:
+            path, _, segment = path.rpartition("/")
             if "." in segment:
+                # Full unquote keeps UTF-8 escapes (e.g. "%C3%AB" in Dutch
+                # filenames) correct
                 return unquote(segment)
         
         return "unknown_file"
@@ -25,24 +25,112 @@ Author: YamieBot Team
 Last Updated: February 2026
 """
 
+import queue
+import threading
+import time
 import structlog
-from datetime import datetime
-from typing import Optional, List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
+from typing import Optional, List, Dict, Any, Iterable, Iterator
 from dataclasses import dataclass, field
 
-from llama_index.core import VectorStoreIndex
-from llama_index.core.schema import Document, BaseNode
-from llama_index.embeddings.openai import OpenAIEmbedding
-from pinecone import Pinecone
+from llama_index.core.schema import Document, BaseNode, MetadataMode
 
 from src.config import Config, get_config
-from src.ingestion.notion_loader import NotionLoader
+from src.ingestion.notion_loader import (
+    DOCX_SUPPORT,
+    PDF_BACKEND,
+    NotionLoader,
+    release_pdf_pool,
+    retain_pdf_pool,
+)
 from src.ingestion.chunker import DocumentChunker
-from src.ingestion.vector_store import create_storage_context
+from src.ingestion.vector_store import (
+    CHUNK_ID_FORMAT,
+    CONTENT_HASH_KEY,
+    assign_chunk_id,
+    clear_namespace_vectors,
+    create_storage_context,
+    delete_stale_chunks,
+    get_pinecone_index,
+    unchanged_node_ids,
+    upsert_nodes,
+)
+from src.ingestion.ingestion_manifest import open_ingestion_manifest, source_fingerprint
+from src.memory.conversation_memory import bump_content_version
+from src.ingestion.embedding_cache import (
+    TIKTOKEN_AVAILABLE,
+    TokenBudget,
+    count_tokens,
+    embed_nodes,
+    open_embedding_cache,
+    request_batch_size,
+)
 
 logger = structlog.get_logger(__name__)
 
 
+def _batched(items: Iterable, size: int) -> Iterator[list]:
+    """Group an iterable into lists of up to `size` items."""
+    items = iter(items)
+    while batch := list(islice(items, size)):
+        yield batch
+
+
+_END_OF_STREAM = object()
+
+
+def _prefetched(items: Iterable, max_ahead: int = 1) -> Iterator:
+    """
+    Produce items in a background thread, at most `max_ahead` ahead of the consumer.
+
+    Lets loading/chunking the next batch overlap with embedding/upserting the
+    current one, while the bounded queue caps how much sits in memory.
+    Exceptions from the producer are re-raised in the consumer.
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=max_ahead)
+    stopped = threading.Event()
+
+    def put(entry) -> bool:
+        # Poll so the producer exits if the consumer gives up (e.g. upsert failed)
+        while not stopped.is_set():
+            try:
+                buffer.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in items:
+                if not put((item, None)):
+                    return
+            put((_END_OF_STREAM, None))
+        except Exception as e:
+            put((_END_OF_STREAM, e))
+        finally:
+            # Stop upstream generators (and their own prefetch threads) now,
+            # not whenever they're garbage-collected
+            close = getattr(items, "close", None)
+            if close:
+                close()
+
+    producer = threading.Thread(target=produce, name="ingestion-prefetch", daemon=True)
+    producer.start()
+    try:
+        while True:
+            item, error = buffer.get()
+            if item is _END_OF_STREAM:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stopped.set()
+        producer.join()
+
+
 # =============================================================================
 # NOTION SOURCES REGISTRY
 # =============================================================================
@@ -127,7 +215,7 @@ class IngestionResult:
     """Results from a single source ingestion."""
     source_name: str
     namespace: str
-    status: str  # "success", "failed", "skipped"
+    status: str  # "success", "partial", "failed", "skipped", "unchanged", "dry_run"
     documents_loaded: int = 0
     chunks_created: int = 0
     duration_seconds: float = 0.0
@@ -163,6 +251,10 @@ class NotionIngestionPipeline:
     - Cost estimation
     """
     
+    # Back-to-back get_namespace_stats calls (one per namespace) share one
+    # describe_index_stats round-trip
+    STATS_TTL_SECONDS = 5.0
+    
     def __init__(self, config: Optional[Config] = None):
         """
         Initialize the Notion ingestion pipeline.
@@ -175,6 +267,23 @@ class NotionIngestionPipeline:
         # Initialize components
         self.notion_loader = NotionLoader()
         self.chunker = DocumentChunker(self.config)
+        self.embedding_cache = open_embedding_cache(self.config)
+        self.manifest = open_ingestion_manifest(self.config)
+        # Shared by every source's embedding requests (None = no TPM pacing)
+        self.token_budget = (
+            TokenBudget(self.config.embedding_tokens_per_minute)
+            if self.config.embedding_tokens_per_minute > 0 else None
+        )
+        
+        # Last index stats (reused for STATS_TTL_SECONDS)
+        self._index_stats = None
+        self._index_stats_fetched_at = 0.0
+        
+        if not TIKTOKEN_AVAILABLE:
+            logger.warning(
+                "tiktoken_not_installed",
+                message="Using rough token estimate. Install tiktoken for accuracy: pip install tiktoken"
+            )
         
         logger.info(
             "notion_pipeline_initialized",
@@ -196,10 +305,17 @@ class NotionIngestionPipeline:
         dry_run: bool = False,
         include_nested: bool = True,
         include_files: bool = True,
+        notion_loader: Optional[NotionLoader] = None,
+        force: bool = False,
+        batch_api: bool = False,
     ) -> IngestionResult:
         """
         Ingest a single Notion page tree into Pinecone.
         
+        The tree's pages and last_edited_time values are enumerated first; if
+        they (and the ingestion settings) match the namespace's last successful
+        ingestion, nothing is loaded and the result is "unchanged".
+        
         Args:
             page_id: Notion page ID to start from
             namespace: Pinecone namespace for this content
@@ -208,11 +324,17 @@ class NotionIngestionPipeline:
             dry_run: If True, loads and chunks but doesn't embed/store
             include_nested: Whether to recursively load child pages
             include_files: Whether to extract embedded PDF/DOCX files
+            notion_loader: Loader to use (default: the pipeline's own). Concurrent
+                           ingestions each need their own loader.
+            force: Re-ingest even if the source is unchanged since the last run
+            batch_api: Embed via the OpenAI Batch API if the source has at least
+                       config.batch_api_threshold chunks
             
         Returns:
             IngestionResult with statistics and status
         """
-        start_time = datetime.utcnow()
+        start_time = time.perf_counter()
+        notion_loader = notion_loader or self.notion_loader
         
         logger.info(
             "page_ingestion_started",
@@ -223,17 +345,47 @@ class NotionIngestionPipeline:
             dry_run=dry_run,
         )
         
+        retain_pdf_pool()
         try:
-            # Stage 1: Load from Notion
+            waits_before = notion_loader.rate_limit_waits
+            wait_seconds_before = notion_loader.rate_limit_wait_seconds
+            failures_before = notion_loader.load_failures
+            
+            # Skip unchanged sources: compare the tree's edit times (page
+            # metadata only, no content) with the last successful ingestion
+            fingerprint = None
+            if self.manifest and not dry_run:
+                fingerprint = source_fingerprint(
+                    notion_loader.enumerate_pages(page_id),
+                    self._ingestion_settings(include_nested, include_files),
+                )
+                if not (force or clear_existing) and self.manifest.get(namespace) == fingerprint:
+                    logger.info("source_unchanged", name=name, namespace=namespace)
+                    return IngestionResult(
+                        source_name=name,
+                        namespace=namespace,
+                        status="unchanged",
+                        duration_seconds=round(self._elapsed(start_time), 2),
+                        details=self._rate_limit_details(notion_loader, waits_before, wait_seconds_before),
+                    )
+                # The namespace is about to change — a failure part-way must
+                # not leave the old fingerprint claiming it's up to date
+                self.manifest.invalidate(namespace)
+            
+            # Stage 1: Load from Notion (streamed — each page's documents are
+            # chunked as soon as they're loaded, then released)
             logger.info("stage_started", stage="1/3", name="Loading from Notion")
-            documents = self.notion_loader.load_from_page(
+            documents = notion_loader.iter_documents(
                 page_id=page_id,
                 namespace=namespace,
                 include_nested_pages=include_nested,
                 include_files=include_files,
+                # Reuse the pages/blocks the fingerprint walk just fetched
+                reset_memo=fingerprint is None,
             )
             
-            if not documents:
+            first_document = next(documents, None)
+            if first_document is None:
                 logger.warning("no_documents_loaded", name=name)
                 return IngestionResult(
                     source_name=name,
@@ -243,68 +395,149 @@ class NotionIngestionPipeline:
                     duration_seconds=self._elapsed(start_time),
                 )
             
-            logger.info(
-                "documents_loaded",
-                count=len(documents),
-                pages=sum(1 for d in documents if d.metadata.get("source_type") == "notion_page"),
-                files=sum(1 for d in documents if "embedded" in d.metadata.get("source_type", "")),
-            )
-            
-            # Stage 2: Chunk documents
+            # Stage 2: Chunk documents (streamed into stage 3 batch by batch)
             logger.info("stage_started", stage="2/3", name="Chunking documents")
-            nodes = self.chunker.chunk(documents)
-            
-            logger.info("chunks_created", count=len(nodes))
+            doc_stats = {"count": 0, "pages": 0, "files": 0}
+            nodes = self.chunker.iter_chunk(
+                self._tally_documents(chain([first_document], documents), doc_stats)
+            )
+            chunks_created = 0
             
             # Dry run exit point
             if dry_run:
-                cost_estimate = self._estimate_cost(nodes)
+                cost_estimate = 0.0
+                for batch in _batched(nodes, self.config.embedding_batch_size):
+                    cost_estimate += self._estimate_cost(batch)
+                    chunks_created += len(batch)
+                
+                rate_limit_details = self._rate_limit_details(notion_loader, waits_before, wait_seconds_before)
+                self._log_documents_loaded(doc_stats, chunks_created, rate_limit_details)
                 logger.info(
                     "dry_run_complete",
-                    documents=len(documents),
-                    chunks=len(nodes),
+                    documents=doc_stats["count"],
+                    chunks=chunks_created,
                     estimated_cost_usd=round(cost_estimate, 4),
                 )
                 return IngestionResult(
                     source_name=name,
                     namespace=namespace,
                     status="dry_run",
-                    documents_loaded=len(documents),
-                    chunks_created=len(nodes),
+                    documents_loaded=doc_stats["count"],
+                    chunks_created=chunks_created,
                     duration_seconds=self._elapsed(start_time),
-                    details={"estimated_cost_usd": round(cost_estimate, 4)},
+                    details={"estimated_cost_usd": round(cost_estimate, 4), **rate_limit_details},
                 )
             
             # Stage 3: Embed and store
             logger.info("stage_started", stage="3/3", name="Embedding and storing")
             
-            # Temporarily override config namespace for this ingestion
-            original_namespace = self.config.pinecone_namespace
-            self.config.pinecone_namespace = namespace
+            # Namespace passed explicitly — the shared config is never mutated,
+            # so sources can run concurrently
+            storage_context = create_storage_context(self.config, namespace=namespace)
+            vector_store = storage_context.vector_store
             
-            try:
-                storage_context = create_storage_context(
-                    self.config,
-                    clear_namespace=clear_existing,
-                )
-                
-                embed_model = OpenAIEmbedding(
-                    model=self.config.embedding_model,
-                    dimensions=self.config.embedding_dimensions,
-                    embed_batch_size=self.config.embedding_batch_size,
-                )
-                
-                # Build index (embeds + stores)
-                VectorStoreIndex(
-                    nodes=nodes,
-                    storage_context=storage_context,
-                    embed_model=embed_model,
-                    show_progress=True,
+            # Clearing (delete + waiting for it to propagate) runs in the
+            # background while the source is loaded and embedded; it only has
+            # to finish before the first upsert
+            clear_future = None
+            if clear_existing:
+                clear_executor = ThreadPoolExecutor(max_workers=1)
+                clear_future = clear_executor.submit(clear_namespace_vectors, vector_store.client, namespace)
+                clear_executor.shutdown(wait=False)  # Worker exits once the clear is done
+            
+            # Imported here: the OpenAI client is slow to import and dry runs never need it
+            from llama_index.embeddings.openai import OpenAIEmbedding
+            
+            embed_model = OpenAIEmbedding(
+                model=self.config.embedding_model,
+                dimensions=self.config.embedding_dimensions,
+                embed_batch_size=request_batch_size(self.config),
+            )
+            
+            # One batch = one round of concurrent embedding requests. Three
+            # stages run at once, each a bounded queue apart: load + chunk the
+            # next batch, embed the current one, upsert the previous one — so
+            # only ~3 batches of chunks are ever in memory.
+            upsert_batch_size = self.config.embedding_batch_size * self.config.embedding_concurrency
+            
+            chunks_unchanged = 0
+            
+            # Deterministic {page_id}::chunk::NNNN IDs (numbered per Notion
+            # page) plus a content hash in metadata
+            chunk_counts: Dict[str, int] = {}
+            nodes = self._with_chunk_ids(nodes, chunk_counts)
+            
+            # Batch API: the whole source is embedded up front into the cache
+            # at half price; the stages below then only read cached vectors
+            if batch_api:
+                nodes = self._embed_with_batch_api(nodes, vector_store, namespace, clear_existing)
+            
+            def embedded_batches(batches: Iterable[List[BaseNode]]) -> Iterator[List[BaseNode]]:
+                nonlocal chunks_unchanged
+                for batch in batches:
+                    # Chunks already stored under the same ID with the same
+                    # content hash are unchanged — skip embedding and upserting them
+                    if not clear_existing:
+                        unchanged = unchanged_node_ids(vector_store, batch, namespace)
+                        if unchanged:
+                            chunks_unchanged += len(unchanged)
+                            batch = [node for node in batch if node.id_ not in unchanged]
+                            if not batch:
+                                continue
+                    
+                    # Embed each unique chunk once, reusing cached vectors for
+                    # unchanged chunks — only new content hits OpenAI
+                    embed_nodes(
+                        batch,
+                        embed_model,
+                        self.embedding_cache,
+                        concurrency=self.config.embedding_concurrency,
+                        token_budget=self.token_budget,
+                    )
+                    yield batch
+            
+            for batch in _prefetched(embedded_batches(_prefetched(_batched(nodes, upsert_batch_size)))):
+                if clear_future is not None:
+                    clear_future.result()  # Re-raises a failed clear
+                    clear_future = None
+                # Store the already-embedded batch (no in-memory index needed)
+                upsert_nodes(vector_store, batch, self.config)
+                chunks_created += len(batch)
+                logger.info("chunks_stored", count=len(batch), total=chunks_created)
+            
+            if clear_future is not None:
+                clear_future.result()  # Nothing was upserted — still report a failed clear
+            
+            # A failed Notion request or file extraction dropped content: the
+            # chunk counts are too low and the stored source isn't up to date
+            load_failures = notion_loader.load_failures - failures_before
+            if load_failures:
+                logger.warning(
+                    "source_load_incomplete",
+                    name=name,
+                    namespace=namespace,
+                    load_failures=load_failures,
+                    action="keeping_existing_chunks",
                 )
-                
-            finally:
-                # Restore original namespace
-                self.config.pinecone_namespace = original_namespace
+            
+            # Pages that shrank leave chunks past their new count behind —
+            # delete them (a cleared namespace has none)
+            elif not clear_existing:
+                delete_stale_chunks(vector_store.client, namespace, chunk_counts)
+            
+            # Unchanged chunks are still part of the source, just not rewritten
+            chunks_created += chunks_unchanged
+            rate_limit_details = self._rate_limit_details(notion_loader, waits_before, wait_seconds_before)
+            self._log_documents_loaded(doc_stats, chunks_created, rate_limit_details)
+            
+            # Vector counts just changed — don't serve stats from before the upsert
+            self._index_stats = None
+            # ...and the agent's cached answers may be out of date
+            bump_content_version(self.config)
+            
+            # Only a complete load may mark the source as up to date
+            if fingerprint and not load_failures:
+                self.manifest.put(namespace, fingerprint)
             
             duration = self._elapsed(start_time)
             
@@ -312,18 +545,29 @@ class NotionIngestionPipeline:
                 "page_ingestion_complete",
                 name=name,
                 namespace=namespace,
-                documents=len(documents),
-                chunks=len(nodes),
+                documents=doc_stats["count"],
+                chunks=chunks_created,
+                chunks_unchanged=chunks_unchanged,
+                load_failures=load_failures,
                 duration_seconds=round(duration, 2),
             )
             
             return IngestionResult(
                 source_name=name,
                 namespace=namespace,
-                status="success",
-                documents_loaded=len(documents),
-                chunks_created=len(nodes),
+                status="partial" if load_failures else "success",
+                documents_loaded=doc_stats["count"],
+                chunks_created=chunks_created,
                 duration_seconds=round(duration, 2),
+                error=(
+                    f"{load_failures} Notion request(s)/file extraction(s) failed — "
+                    "content may be missing; re-run to complete"
+                ) if load_failures else None,
+                details={
+                    "chunks_unchanged": chunks_unchanged,
+                    "load_failures": load_failures,
+                    **rate_limit_details,
+                },
             )
             
         except Exception as e:
@@ -340,12 +584,17 @@ class NotionIngestionPipeline:
                 error=str(e),
                 duration_seconds=self._elapsed(start_time),
             )
+        finally:
+            release_pdf_pool()
     
     def ingest_source(
         self,
         source_key: str,
         clear_existing: bool = False,
         dry_run: bool = False,
+        notion_loader: Optional[NotionLoader] = None,
+        force: bool = False,
+        batch_api: bool = False,
     ) -> IngestionResult:
         """
         Ingest a registered Notion source by its key.
@@ -354,6 +603,10 @@ class NotionIngestionPipeline:
             source_key: Key from NOTION_SOURCES registry
             clear_existing: If True, clears namespace before ingesting
             dry_run: If True, loads and chunks but doesn't embed/store
+            notion_loader: Loader to use (default: the pipeline's own)
+            force: Re-ingest even if the source is unchanged since the last run
+            batch_api: Embed via the OpenAI Batch API if the source has at least
+                       config.batch_api_threshold chunks
             
         Returns:
             IngestionResult with statistics and status
@@ -382,6 +635,9 @@ class NotionIngestionPipeline:
             dry_run=dry_run,
             include_nested=source.include_nested,
             include_files=source.include_files,
+            notion_loader=notion_loader,
+            force=force,
+            batch_api=batch_api,
         )
     
     def ingest_all(
@@ -389,19 +645,28 @@ class NotionIngestionPipeline:
         clear_existing: bool = False,
         dry_run: bool = False,
         source_keys: Optional[List[str]] = None,
+        force: bool = False,
+        batch_api: bool = False,
     ) -> PipelineResult:
         """
         Ingest multiple Notion sources.
         
+        Sources go to disjoint namespaces, so up to config.max_concurrent_sources
+        run at once (threads — the work is network-bound). Each gets its own
+        NotionLoader sharing one rate limiter, so together they still respect
+        Notion's per-integration request limit.
+        
         Args:
             clear_existing: If True, clears each namespace before ingesting
             dry_run: If True, loads and chunks but doesn't embed/store
             source_keys: Specific sources to ingest (defaults to all registered)
+            force: Re-ingest sources even if unchanged since their last run
+            batch_api: Embed large sources via the OpenAI Batch API
             
         Returns:
             PipelineResult with overall statistics and per-source results
         """
-        start_time = datetime.utcnow()
+        start_time = time.perf_counter()
         
         # Determine which sources to process
         keys_to_process = source_keys or list(NOTION_SOURCES.keys())
@@ -414,35 +679,57 @@ class NotionIngestionPipeline:
             dry_run=dry_run,
         )
         
-        results = []
-        total_docs = 0
-        total_chunks = 0
-        failed_count = 0
+        workers = max(1, min(self.config.max_concurrent_sources, len(keys_to_process)))
         
-        for i, source_key in enumerate(keys_to_process, 1):
+        def run_source(numbered_key) -> IngestionResult:
+            i, source_key = numbered_key
             logger.info(
                 "processing_source",
                 source=source_key,
                 progress=f"{i}/{len(keys_to_process)}",
             )
             
-            result = self.ingest_source(
+            # A loader keeps per-walk state, so concurrent sources can't share one
+            loader = self.notion_loader if workers == 1 else NotionLoader(
+                rate_limiter=self.notion_loader.rate_limiter,
+            )
+            
+            return self.ingest_source(
                 source_key=source_key,
                 clear_existing=clear_existing,
                 dry_run=dry_run,
+                notion_loader=loader,
+                force=force,
+                batch_api=batch_api,
             )
-            
-            results.append(result)
+        
+        # Held across all sources so the PDF pool isn't respawned for each one
+        retain_pdf_pool()
+        try:
+            # map() returns results in source order regardless of completion order
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(run_source, enumerate(keys_to_process, 1)))
+        finally:
+            release_pdf_pool()
+        
+        total_docs = 0
+        total_chunks = 0
+        failed_count = 0
+        partial_count = 0
+        
+        for result in results:
             total_docs += result.documents_loaded
             total_chunks += result.chunks_created
             
             if result.status == "failed":
                 failed_count += 1
+            elif result.status == "partial":
+                partial_count += 1
         
         duration = self._elapsed(start_time)
         
         # Determine overall status
-        if failed_count == 0:
+        if failed_count == 0 and partial_count == 0:
             status = "success"
         elif failed_count < len(keys_to_process):
             status = "partial"
@@ -501,9 +788,7 @@ class NotionIngestionPipeline:
             Dictionary with vector count and other stats
         """
         try:
-            pc = Pinecone(api_key=self.config.pinecone_api_key)
-            index = pc.Index(self.config.pinecone_index_name)
-            stats = index.describe_index_stats()
+            stats = self._get_index_stats()
             
             namespace_stats = stats.get("namespaces", {}).get(namespace, {})
             
@@ -516,9 +801,113 @@ class NotionIngestionPipeline:
             logger.error("stats_fetch_failed", namespace=namespace, error=str(e))
             return {"namespace": namespace, "error": str(e)}
     
-    def _elapsed(self, start_time: datetime) -> float:
-        """Calculate elapsed seconds from start time."""
-        return (datetime.utcnow() - start_time).total_seconds()
+    def _get_index_stats(self):
+        """describe_index_stats(), reusing the index handle and recent results."""
+        now = time.monotonic()
+        if self._index_stats is not None and now - self._index_stats_fetched_at < self.STATS_TTL_SECONDS:
+            return self._index_stats
+        
+        self._index_stats = get_pinecone_index(self.config).describe_index_stats()
+        self._index_stats_fetched_at = now
+        return self._index_stats
+    
+    def _embed_with_batch_api(
+        self,
+        nodes: Iterable[BaseNode],
+        vector_store,
+        namespace: str,
+        clear_existing: bool,
+    ) -> List[BaseNode]:
+        """
+        Embed a source's new chunks via the OpenAI Batch API, into the embedding cache.
+        
+        Only used when the source has at least config.batch_api_threshold
+        chunks and the cache is enabled (vectors are delivered through it).
+        Chunks already stored in the namespace are not sent.
+        
+        Returns:
+            All of the source's nodes, as a list
+        """
+        nodes = list(nodes)
+        if self.embedding_cache is None:
+            logger.warning("batch_api_unavailable", reason="embedding_cache_disabled")
+            return nodes
+        if len(nodes) < self.config.batch_api_threshold:
+            logger.info("batch_api_skipped", chunks=len(nodes), threshold=self.config.batch_api_threshold)
+            return nodes
+        
+        # Imported here: only batch ingestions need it
+        from src.ingestion.batch_embeddings import embed_via_batch_api
+        
+        new_nodes = nodes
+        if not clear_existing:
+            unchanged = unchanged_node_ids(vector_store, nodes, namespace)
+            new_nodes = [node for node in nodes if node.id_ not in unchanged]
+        
+        embed_via_batch_api(
+            [node.get_content(metadata_mode=MetadataMode.EMBED) for node in new_nodes],
+            self.config,
+            self.embedding_cache,
+        )
+        return nodes
+    
+    def _with_chunk_ids(self, nodes: Iterable[BaseNode], chunk_counts: Dict[str, int]) -> Iterator[BaseNode]:
+        """Pass nodes through, assigning each its vector ID and content hash (see assign_chunk_id)."""
+        for node in nodes:
+            assign_chunk_id(node, self.config, chunk_counts)
+            yield node
+    
+    @staticmethod
+    def _tally_documents(documents: Iterable[Document], stats: Dict[str, int]) -> Iterator[Document]:
+        """Pass documents through unchanged, counting them (total/pages/files) into stats."""
+        for doc in documents:
+            source_type = doc.metadata.get("source_type", "")
+            stats["count"] += 1
+            if source_type == "notion_page":
+                stats["pages"] += 1
+            elif "embedded" in source_type:
+                stats["files"] += 1
+            yield doc
+    
+    def _ingestion_settings(self, include_nested: bool, include_files: bool) -> Dict[str, Any]:
+        """Settings that change what gets stored (part of the source fingerprint)."""
+        return {
+            "include_nested": include_nested,
+            "include_files": include_files,
+            "chunk_size": self.config.chunk_size,
+            "chunk_overlap": self.config.chunk_overlap,
+            "min_chunk_chars": self.config.min_chunk_chars,
+            "embedding_model": self.config.embedding_model,
+            "embedding_dimensions": self.config.embedding_dimensions,
+            # Vector IDs/metadata and file text depend on these too
+            "vector_ids": [CHUNK_ID_FORMAT, CONTENT_HASH_KEY],
+            "pdf_backend": PDF_BACKEND,
+            "docx_support": DOCX_SUPPORT,
+        }
+    
+    @staticmethod
+    def _rate_limit_details(notion_loader: NotionLoader, waits_before: int, wait_seconds_before: float) -> Dict[str, Any]:
+        """Rate-limit waits this ingestion's loader incurred since the given counter values."""
+        return {
+            "rate_limit_waits": notion_loader.rate_limit_waits - waits_before,
+            "rate_limit_wait_seconds": round(notion_loader.rate_limit_wait_seconds - wait_seconds_before, 2),
+        }
+    
+    @staticmethod
+    def _log_documents_loaded(doc_stats: Dict[str, int], chunks_created: int, rate_limit_details: Dict[str, Any]) -> None:
+        """Log load/chunk totals once the document stream has been drained."""
+        logger.info(
+            "documents_loaded",
+            count=doc_stats["count"],
+            pages=doc_stats["pages"],
+            files=doc_stats["files"],
+            **rate_limit_details,
+        )
+        logger.info("chunks_created", count=chunks_created)
+    
+    def _elapsed(self, start_time: float) -> float:
+        """Calculate elapsed seconds from a time.perf_counter() start time."""
+        return time.perf_counter() - start_time
     
     def _estimate_cost(self, nodes: List[BaseNode]) -> float:
         """
@@ -528,22 +917,14 @@ class NotionIngestionPipeline:
         - text-embedding-3-large: $0.00013 per 1K tokens
         - text-embedding-3-small: $0.00002 per 1K tokens
         """
-        try:
-            import tiktoken
-            
-            # Use cl100k_base encoding (used by text-embedding-3 models)
-            encoding = tiktoken.get_encoding("cl100k_base")
-            
-            # Accurately count tokens
-            total_tokens = sum(len(encoding.encode(node.text)) for node in nodes)
-            
-        except ImportError:
-            # Fallback to rough estimate if tiktoken not installed
-            logger.warning(
-                "tiktoken_not_installed",
-                message="Using rough token estimate. Install tiktoken for accuracy: pip install tiktoken"
-            )
-            total_tokens = sum(len(node.text.split()) * 1.3 for node in nodes)
+        # Accurate count with tiktoken, rough words × 1.3 estimate without it.
+        # Count what is actually sent (chunk text + embedded metadata header).
+        texts = [node.get_content(metadata_mode=MetadataMode.EMBED) for node in nodes]
+        token_counts = count_tokens(texts, self.config.embedding_model)
+        if token_counts is not None:
+            total_tokens = sum(token_counts)
+        else:
+            total_tokens = sum(len(text.split()) for text in texts) * 1.3
         
         # Determine cost per 1K tokens based on model
         if "small" in self.config.embedding_model.lower():
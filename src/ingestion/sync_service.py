@@ -22,30 +22,32 @@ Usage:
     result = service.sync_all(force_full=True)
 """
 
+import time
 import structlog
 from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any
 from dataclasses import dataclass, field
 
 from pinecone import Pinecone
-from llama_index.core import VectorStoreIndex
 from llama_index.vector_stores.pinecone import PineconeVectorStore
-from llama_index.core import StorageContext
 from llama_index.embeddings.openai import OpenAIEmbedding
 
 from src.config import Config, get_config
-from src.ingestion.notion_loader import NotionLoader
+from src.ingestion.notion_loader import NotionLoader, release_pdf_pool, retain_pdf_pool
 from src.ingestion.notion_pipeline import NOTION_SOURCES, NotionSource
 from src.ingestion.chunker import DocumentChunker
+from src.ingestion.vector_store import (
+    MAX_CHUNKS_PER_PAGE,
+    assign_chunk_id,
+    chunk_vector_id,
+    upsert_nodes,
+)
+from src.ingestion.embedding_cache import TokenBudget, embed_nodes, open_embedding_cache, request_batch_size
+from src.memory.conversation_memory import bump_content_version
 
 logger = structlog.get_logger(__name__)
 
 
-# Max chunks we expect per page — used for deletion.
-# Pinecone silently ignores IDs that don't exist, so overshooting is safe.
-MAX_CHUNKS_PER_PAGE = 200
-
-
 # =============================================================================
 # RESULT DATACLASSES
 # =============================================================================
@@ -127,7 +129,12 @@ class ContentSyncService:
         self._embed_model = OpenAIEmbedding(
             model=self.config.embedding_model,
             dimensions=self.config.embedding_dimensions,
-            embed_batch_size=self.config.embedding_batch_size,
+            embed_batch_size=request_batch_size(self.config),
+        )
+        self._embedding_cache = open_embedding_cache(self.config)
+        self._token_budget = (
+            TokenBudget(self.config.embedding_tokens_per_minute)
+            if self.config.embedding_tokens_per_minute > 0 else None
         )
 
         # Supabase client for sync tracking
@@ -163,6 +170,7 @@ class ContentSyncService:
             SyncResult with detailed statistics
         """
         start_time = datetime.now(timezone.utc)
+        timer_start = time.perf_counter()
 
         keys = source_keys or list(NOTION_SOURCES.keys())
 
@@ -179,19 +187,24 @@ class ContentSyncService:
         total_deleted = 0
         sources_with_changes = 0
 
-        for source_key in keys:
-            result = self.sync_source(
-                source_key=source_key,
-                force_full=force_full,
-            )
-            source_results.append(result)
-            total_pages_changed += result.pages_changed
-            total_chunks += result.total_chunks_upserted
-            total_deleted += result.total_vectors_deleted
-            if result.pages_changed > 0:
-                sources_with_changes += 1
-
-        duration = (datetime.now(timezone.utc) - start_time).total_seconds()
+        # Held across all sources so the PDF pool isn't respawned for each one
+        retain_pdf_pool()
+        try:
+            for source_key in keys:
+                result = self.sync_source(
+                    source_key=source_key,
+                    force_full=force_full,
+                )
+                source_results.append(result)
+                total_pages_changed += result.pages_changed
+                total_chunks += result.total_chunks_upserted
+                total_deleted += result.total_vectors_deleted
+                if result.pages_changed > 0:
+                    sources_with_changes += 1
+        finally:
+            release_pdf_pool()
+
+        duration = time.perf_counter() - timer_start
         completed_at = datetime.now(timezone.utc).isoformat()
 
         # Determine overall status
@@ -219,6 +232,10 @@ class ContentSyncService:
             source_results=source_results,
         )
 
+        # Pinecone content changed — invalidate the agent's cached answers
+        if status != "no_changes" or total_deleted:
+            bump_content_version(self.config)
+
         # Log to Supabase
         self._log_sync_result(sync_result)
 
@@ -248,7 +265,7 @@ class ContentSyncService:
         Returns:
             SourceSyncResult with per-page details
         """
-        start_time = datetime.now(timezone.utc)
+        start_time = time.perf_counter()
 
         if source_key not in NOTION_SOURCES:
             return SourceSyncResult(
@@ -267,6 +284,7 @@ class ContentSyncService:
             force_full=force_full,
         )
 
+        retain_pdf_pool()
         try:
             # Step 1: Enumerate all pages in this source tree
             all_pages = self.notion_loader.enumerate_pages(source.page_id)
@@ -303,7 +321,7 @@ class ContentSyncService:
             )
 
             if not changed_pages and not orphan_results:
-                duration = (datetime.now(timezone.utc) - start_time).total_seconds()
+                duration = time.perf_counter() - start_time
                 return SourceSyncResult(
                     source_key=source_key,
                     namespace=source.namespace,
@@ -342,7 +360,7 @@ class ContentSyncService:
             # Include orphan results in page_results
             page_results.extend(orphan_results)
 
-            duration = (datetime.now(timezone.utc) - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
 
             # Determine status
             if failed == len(changed_pages) and len(changed_pages) > 0:
@@ -369,7 +387,7 @@ class ContentSyncService:
             )
 
         except Exception as e:
-            duration = (datetime.now(timezone.utc) - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
             logger.error(
                 "sync_source_failed",
                 source=source_key,
@@ -383,6 +401,8 @@ class ContentSyncService:
                 error=str(e),
                 duration_seconds=round(duration, 2),
             )
+        finally:
+            release_pdf_pool()
 
     def get_sync_status(self) -> Dict[str, Any]:
         """
@@ -412,7 +432,7 @@ class ContentSyncService:
     ) -> PageSyncResult:
         """
         Sync a single page: delete old vectors, load content, chunk, embed, upsert.
-        Uses LlamaIndex VectorStoreIndex for upsert to keep metadata format
+        Upserts through LlamaIndex's PineconeVectorStore to keep metadata format
         identical to the existing pipeline (retriever compatibility).
         """
         try:
@@ -446,24 +466,31 @@ class ContentSyncService:
             # (which generates "{page_id}::chunk::0004") never matches, causing:
             #   1. Duplicates on every sync (deletes miss, upserts pile up)
             #   2. Orphan detection seeing 0 matches (different ID formats)
-            for i, node in enumerate(nodes):
-                node.id_ = self._make_vector_id(page_id, i)
+            # assign_chunk_id does both (and records the content hash the
+            # ingestion pipeline uses to skip unchanged chunks).
+            chunk_counts: Dict[str, int] = {}
+            for node in nodes:
                 node.metadata["notion_page_id"] = page_id
-                node.relationships = {}  # Prevent ref_doc_id prefix in Pinecone ID
+                assign_chunk_id(node, self.config, chunk_counts)
+
+            # Step E: Embed each unique chunk once, reusing cached vectors for
+            # unchanged chunks — only new content hits OpenAI
+            embed_nodes(
+                nodes,
+                self._embed_model,
+                self._embedding_cache,
+                concurrency=self.config.embedding_concurrency,
+                token_budget=self._token_budget,
+            )
 
-            # Step E: Upsert via LlamaIndex (handles embedding + Pinecone metadata format)
+            # Step F: Upsert via LlamaIndex's vector store (handles Pinecone
+            # metadata format). Nodes are already embedded, so no index is built.
             vector_store = PineconeVectorStore(
                 pinecone_index=self._index,
                 namespace=namespace,
+                batch_size=self.config.pinecone_upsert_batch_size,
             )
-            storage_context = StorageContext.from_defaults(vector_store=vector_store)
-
-            VectorStoreIndex(
-                nodes=nodes,
-                storage_context=storage_context,
-                embed_model=self._embed_model,
-                show_progress=False,
-            )
+            upsert_nodes(vector_store, nodes, self.config)
 
             logger.info(
                 "page_synced",
@@ -505,7 +532,7 @@ class ContentSyncService:
         Generate a deterministic vector ID for a chunk.
         Format: {page_id}::chunk::{index:04d}
         """
-        return f"{page_id}::chunk::{chunk_index:04d}"
+        return chunk_vector_id(page_id, chunk_index)
 
     def _delete_vectors_for_page(self, page_id: str, namespace: str) -> int:
         """
@@ -3,18 +3,203 @@ Pinecone vector store initialization and management.
 Handles index creation, namespace management, and StorageContext setup.
 """
 
+import hashlib
 import structlog
+import threading
 import time
-from pinecone import Pinecone, ServerlessSpec
-from llama_index.vector_stores.pinecone import PineconeVectorStore
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 from llama_index.core import StorageContext
+from llama_index.core.schema import BaseNode, MetadataMode
 
 from src.config import Config
 
+# pinecone and the LlamaIndex Pinecone integration are imported where they're
+# used — importing them costs seconds, and dry runs never touch Pinecone
+if TYPE_CHECKING:
+    from llama_index.vector_stores.pinecone import PineconeVectorStore
+
 logger = structlog.get_logger(__name__)
 
 
-def create_storage_context(config: Config, clear_namespace: bool = False) -> StorageContext:
+def _pinecone_client_class():
+    """
+    Pinecone client class for the ingestion path.
+    
+    The gRPC client when installed (pip install "pinecone-client[grpc]") —
+    same index API as REST, lower per-request overhead for bulk upserts.
+    """
+    try:
+        from pinecone.grpc import PineconeGRPC
+        return PineconeGRPC
+    except ImportError:
+        from pinecone import Pinecone
+        return Pinecone
+
+# Max wait for a newly created index to report ready
+INDEX_READY_TIMEOUT_SECONDS = 60.0
+
+# Delete propagation: first recheck after this long, doubling up to the cap,
+# for at most DELETE_PROPAGATION_TIMEOUT_SECONDS in total
+DELETE_POLL_INITIAL_SECONDS = 0.5
+DELETE_POLL_MAX_SECONDS = 3.0
+DELETE_PROPAGATION_TIMEOUT_SECONDS = 30.0
+
+# Clients and index handles are reused across storage contexts (one per
+# source in ingest_all), so their connection pools — TLS sessions, gRPC
+# channels — stay warm instead of being re-established every time.
+# Index handles double as "index confirmed to exist": (api key hash, index
+# name) → (monotonic time seen, handle). They expire so a deleted (or
+# recreated) index is noticed again.
+_KNOWN_INDEX_TTL_SECONDS = 60.0
+_clients: Dict[str, Any] = {}
+_known_indexes: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+_cache_lock = threading.Lock()
+
+
+def _api_key_hash(api_key: str) -> str:
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+
+
+def _get_client(api_key: str):
+    """Shared Pinecone client for an API key (gRPC when installed, REST otherwise)."""
+    key = _api_key_hash(api_key)
+    with _cache_lock:
+        client = _clients.get(key)
+        if client is None:
+            client_class = _pinecone_client_class()
+            client = _clients[key] = client_class(api_key=api_key)
+            logger.debug("pinecone_client_initialized", client=client_class.__name__)
+        return client
+
+
+def _known_index(api_key: str, index_name: str):
+    """Index handle if the index was confirmed to exist recently, else None."""
+    key = (_api_key_hash(api_key), index_name)
+    with _cache_lock:
+        entry = _known_indexes.get(key)
+        if entry is None or time.monotonic() - entry[0] >= _KNOWN_INDEX_TTL_SECONDS:
+            return None
+        return entry[1]
+
+
+def _remember_index(api_key: str, index_name: str, index) -> None:
+    key = (_api_key_hash(api_key), index_name)
+    with _cache_lock:
+        _known_indexes[key] = (time.monotonic(), index)
+
+
+def clear_namespace_vectors(index, namespace: str, stats=None) -> None:
+    """
+    Delete every vector in a namespace and wait for the delete to propagate.
+    
+    Args:
+        index: Pinecone index handle
+        namespace: Namespace to clear
+        stats: describe_index_stats() result to reuse (fetched if None)
+    """
+    logger.info(
+        "pinecone_namespace_clearing_started",
+        namespace=namespace
+    )
+    
+    try:
+        # Check if namespace exists and has vectors
+        if stats is None:
+            stats = index.describe_index_stats()
+        namespaces = stats.get('namespaces', {})
+        namespace_vectors = namespaces.get(namespace, {}).get('vector_count', 0)
+        
+        if namespace_vectors > 0:
+            logger.info(
+                "pinecone_namespace_deleting_vectors",
+                namespace=namespace,
+                vectors_to_delete=namespace_vectors
+            )
+            index.delete(delete_all=True, namespace=namespace)
+            
+            # Wait for delete to propagate — prevents race condition
+            # where freshly upserted vectors get wiped by a pending delete
+            logger.info(
+                "pinecone_waiting_for_delete",
+                namespace=namespace,
+                message="Waiting for delete to propagate..."
+            )
+            delay = DELETE_POLL_INITIAL_SECONDS
+            deadline = time.monotonic() + DELETE_PROPAGATION_TIMEOUT_SECONDS
+            attempt = 0
+            while True:
+                time.sleep(delay)
+                delay = min(delay * 2, DELETE_POLL_MAX_SECONDS)
+                attempt += 1
+                stats_check = index.describe_index_stats()
+                remaining = stats_check.get('namespaces', {}).get(
+                    namespace, {}
+                ).get('vector_count', 0)
+                if remaining == 0:
+                    logger.info(
+                        "pinecone_namespace_cleared",
+                        namespace=namespace,
+                        status="success",
+                        wait_attempts=attempt
+                    )
+                    break
+                if time.monotonic() >= deadline:
+                    logger.warning(
+                        "pinecone_delete_slow_propagation",
+                        namespace=namespace,
+                        remaining_vectors=remaining,
+                        message=f"Proceeding anyway after {DELETE_PROPAGATION_TIMEOUT_SECONDS:.0f}s wait"
+                    )
+                    break
+                logger.debug(
+                    "pinecone_delete_still_propagating",
+                    remaining_vectors=remaining,
+                    attempt=attempt
+                )
+        else:
+            logger.info(
+                "pinecone_namespace_empty",
+                namespace=namespace
+            )
+    
+    except Exception as e:
+        # Namespace might not exist yet - that's okay
+        if "not found" in str(e).lower() or "does not exist" in str(e).lower():
+            logger.info(
+                "pinecone_namespace_not_exists",
+                namespace=namespace,
+                message="Will be created during ingestion"
+            )
+        else:
+            logger.error(
+                "pinecone_namespace_clear_failed",
+                namespace=namespace,
+                error=str(e),
+                error_type=type(e).__name__
+            )
+            raise
+
+
+def get_pinecone_index(config: Config):
+    """
+    Index handle for config.pinecone_index_name, shared with create_storage_context.
+    
+    Reuses the cached client and (recent) index handle, so stats calls don't
+    open new connections either.
+    """
+    index = _known_index(config.pinecone_api_key, config.pinecone_index_name)
+    if index is None:
+        index = _get_client(config.pinecone_api_key).Index(config.pinecone_index_name)
+        _remember_index(config.pinecone_api_key, config.pinecone_index_name, index)
+    return index
+
+
+def create_storage_context(
+    config: Config,
+    namespace: Optional[str] = None,
+    clear_namespace: bool = False,
+) -> StorageContext:
     """
     Create and initialize Pinecone storage context for LlamaIndex.
     
@@ -26,6 +211,8 @@ def create_storage_context(config: Config, clear_namespace: bool = False) -> Sto
     
     Args:
         config: Configuration object with Pinecone settings
+        namespace: Namespace to store into (default: config.pinecone_namespace).
+                   Passed explicitly so concurrent ingestions never share mutable config.
         clear_namespace: If True, deletes all vectors in the namespace before proceeding
         
     Returns:
@@ -35,10 +222,12 @@ def create_storage_context(config: Config, clear_namespace: bool = False) -> Sto
         ValueError: If API key is missing or invalid
         Exception: If Pinecone operations fail
     """
+    namespace = namespace or config.pinecone_namespace
+    
     logger.info(
         "pinecone_initialization_started",
         index=config.pinecone_index_name,
-        namespace=config.pinecone_namespace
+        namespace=namespace
     )
     
     # Validate API key
@@ -47,10 +236,12 @@ def create_storage_context(config: Config, clear_namespace: bool = False) -> Sto
         logger.error("pinecone_api_key_missing")
         raise ValueError(error_msg)
     
-    # Initialize Pinecone client
+    from pinecone import ServerlessSpec
+    from llama_index.vector_stores.pinecone import PineconeVectorStore
+    
+    # Initialize Pinecone client (gRPC when installed, REST otherwise)
     try:
-        pc = Pinecone(api_key=config.pinecone_api_key)
-        logger.debug("pinecone_client_initialized")
+        pc = _get_client(config.pinecone_api_key)
     except Exception as e:
         logger.error(
             "pinecone_client_initialization_failed",
@@ -61,13 +252,17 @@ def create_storage_context(config: Config, clear_namespace: bool = False) -> Sto
     
     # Check if index exists
     index_name = config.pinecone_index_name
+    index = _known_index(config.pinecone_api_key, index_name)
     
     try:
-        existing_indexes = pc.list_indexes().names()
-        logger.debug(
-            "pinecone_indexes_listed",
-            existing_indexes_count=len(existing_indexes)
-        )
+        if index is not None:
+            existing_indexes = [index_name]
+        else:
+            existing_indexes = pc.list_indexes().names()
+            logger.debug(
+                "pinecone_indexes_listed",
+                existing_indexes_count=len(existing_indexes)
+            )
     except Exception as e:
         logger.error(
             "pinecone_list_indexes_failed",
@@ -105,7 +300,13 @@ def create_storage_context(config: Config, clear_namespace: bool = False) -> Sto
             
             # Wait for index to be ready (serverless indexes need initialization time)
             logger.info("pinecone_index_initialization", message="Waiting for index to be ready...")
-            time.sleep(5)  # Give Pinecone time to initialize
+            deadline = time.monotonic() + INDEX_READY_TIMEOUT_SECONDS
+            while not pc.describe_index(index_name).status["ready"]:
+                if time.monotonic() >= deadline:
+                    raise RuntimeError(
+                        f"Index '{index_name}' not ready after {INDEX_READY_TIMEOUT_SECONDS:.0f}s"
+                    )
+                time.sleep(0.5)
             
         except Exception as e:
             logger.error(
@@ -121,9 +322,11 @@ def create_storage_context(config: Config, clear_namespace: bool = False) -> Sto
             index=index_name
         )
     
-    # Connect to index
+    # Connect to index (reusing the handle from a recent storage context)
     try:
-        index = pc.Index(index_name)
+        if index is None:
+            index = pc.Index(index_name)
+        _remember_index(config.pinecone_api_key, index_name, index)
         logger.debug(
             "pinecone_index_connected",
             index=index_name
@@ -137,17 +340,18 @@ def create_storage_context(config: Config, clear_namespace: bool = False) -> Sto
         )
         raise
     
-    # Log current index statistics
+    # Log current index statistics (the clear step below reuses them)
+    stats = None
     try:
         stats = index.describe_index_stats()
         total_vectors = stats.get('total_vector_count', 0)
         namespaces = stats.get('namespaces', {})
-        namespace_vectors = namespaces.get(config.pinecone_namespace, {}).get('vector_count', 0)
+        namespace_vectors = namespaces.get(namespace, {}).get('vector_count', 0)
         
         logger.info(
             "pinecone_index_stats",
             total_vectors_all_namespaces=total_vectors,
-            namespace=config.pinecone_namespace,
+            namespace=namespace,
             namespace_vectors=namespace_vectors
         )
         
@@ -166,86 +370,14 @@ def create_storage_context(config: Config, clear_namespace: bool = False) -> Sto
     
     # Clear namespace if requested
     if clear_namespace:
-        logger.info(
-            "pinecone_namespace_clearing_started",
-            namespace=config.pinecone_namespace
-        )
-        
-        try:
-            # Check if namespace exists and has vectors
-            stats = index.describe_index_stats()
-            namespaces = stats.get('namespaces', {})
-            namespace_vectors = namespaces.get(config.pinecone_namespace, {}).get('vector_count', 0)
-            
-            if namespace_vectors > 0:
-                logger.info(
-                    "pinecone_namespace_deleting_vectors",
-                    namespace=config.pinecone_namespace,
-                    vectors_to_delete=namespace_vectors
-                )
-                index.delete(delete_all=True, namespace=config.pinecone_namespace)
-                
-                # Wait for delete to propagate — prevents race condition
-                # where freshly upserted vectors get wiped by a pending delete
-                logger.info(
-                    "pinecone_waiting_for_delete",
-                    namespace=config.pinecone_namespace,
-                    message="Waiting for delete to propagate..."
-                )
-                for attempt in range(10):
-                    time.sleep(3)
-                    stats_check = index.describe_index_stats()
-                    remaining = stats_check.get('namespaces', {}).get(
-                        config.pinecone_namespace, {}
-                    ).get('vector_count', 0)
-                    if remaining == 0:
-                        logger.info(
-                            "pinecone_namespace_cleared",
-                            namespace=config.pinecone_namespace,
-                            status="success",
-                            wait_attempts=attempt + 1
-                        )
-                        break
-                    logger.debug(
-                        "pinecone_delete_still_propagating",
-                        remaining_vectors=remaining,
-                        attempt=attempt + 1
-                    )
-                else:
-                    logger.warning(
-                        "pinecone_delete_slow_propagation",
-                        namespace=config.pinecone_namespace,
-                        remaining_vectors=remaining,
-                        message="Proceeding anyway after 30s wait"
-                    )
-            else:
-                logger.info(
-                    "pinecone_namespace_empty",
-                    namespace=config.pinecone_namespace
-                )
-                
-        except Exception as e:
-            # Namespace might not exist yet - that's okay
-            if "not found" in str(e).lower() or "does not exist" in str(e).lower():
-                logger.info(
-                    "pinecone_namespace_not_exists",
-                    namespace=config.pinecone_namespace,
-                    message="Will be created during ingestion"
-                )
-            else:
-                logger.error(
-                    "pinecone_namespace_clear_failed",
-                    namespace=config.pinecone_namespace,
-                    error=str(e),
-                    error_type=type(e).__name__
-                )
-                raise
+        clear_namespace_vectors(index, namespace, stats)
     
     # Create vector store wrapper
     try:
         vector_store = PineconeVectorStore(
             pinecone_index=index,
-            namespace=config.pinecone_namespace,
+            namespace=namespace,
+            batch_size=config.pinecone_upsert_batch_size,
         )
         logger.debug("pinecone_vector_store_created")
     except Exception as e:
@@ -273,6 +405,158 @@ def create_storage_context(config: Config, clear_namespace: bool = False) -> Sto
         raise
 
 
+# Max chunks we expect per Notion page — ContentSyncService's page delete
+# covers indices up to this. Pinecone silently ignores IDs that don't exist,
+# so overshooting is safe.
+MAX_CHUNKS_PER_PAGE = 200
+
+# Metadata key holding the hash of a chunk's embedded content
+CONTENT_HASH_KEY = "content_hash"
+
+# Vector ID of a Notion page's chunk (see chunk_vector_id)
+CHUNK_ID_FORMAT = "{page_id}::chunk::{chunk_index:04d}"
+
+
+def chunk_vector_id(page_id: str, chunk_index: int) -> str:
+    """
+    Deterministic vector ID for a chunk of a Notion page.
+    Format: {page_id}::chunk::{index:04d}
+    """
+    return CHUNK_ID_FORMAT.format(page_id=page_id, chunk_index=chunk_index)
+
+
+def assign_chunk_id(node: BaseNode, config: Config, chunk_counts: Dict[str, int]) -> None:
+    """
+    Give a node its deterministic vector ID and record its content hash.
+    
+    IDs follow the {notion_page_id}::chunk::{index:04d} scheme that
+    ContentSyncService's page deletes and orphan detection rely on; chunks
+    are numbered per page in the order they arrive, with chunk_counts
+    (page_id → chunks seen so far) carrying the numbering across batches.
+    Relationships are cleared so PineconeVectorStore uses node.id_ as-is.
+    
+    The hash of (model, dimensions, embedded content) goes into metadata
+    (excluded from the embedded and LLM text), so a re-ingest can tell which
+    stored chunks are unchanged.
+    """
+    page_id = node.metadata["notion_page_id"]
+    chunk_index = chunk_counts.get(page_id, 0)
+    chunk_counts[page_id] = chunk_index + 1
+    if chunk_index == MAX_CHUNKS_PER_PAGE:
+        # ContentSyncService's page delete only covers IDs below the limit
+        logger.warning(
+            "page_exceeds_max_chunks",
+            page_id=page_id,
+            max_chunks=MAX_CHUNKS_PER_PAGE
+        )
+    
+    prefix = f"{config.embedding_model}\0{config.embedding_dimensions}\0".encode("utf-8")
+    content = node.get_content(metadata_mode=MetadataMode.EMBED).encode("utf-8")
+    
+    node.id_ = chunk_vector_id(page_id, chunk_index)
+    node.relationships = {}
+    node.metadata[CONTENT_HASH_KEY] = hashlib.blake2b(prefix + content, digest_size=16).hexdigest()
+    for excluded in (node.excluded_embed_metadata_keys, node.excluded_llm_metadata_keys):
+        if CONTENT_HASH_KEY not in excluded:
+            excluded.append(CONTENT_HASH_KEY)
+
+
+def unchanged_node_ids(vector_store: "PineconeVectorStore", nodes: List[BaseNode], namespace: str) -> Set[str]:
+    """
+    Return the IDs of nodes already stored in the namespace with the same content hash.
+    
+    Fetches in batches of 100. On error returns the IDs found so far — the
+    caller then just re-embeds and re-upserts the rest.
+    """
+    index = vector_store.client
+    hashes = {node.id_: node.metadata[CONTENT_HASH_KEY] for node in nodes}
+    ids = list(hashes)
+    unchanged: Set[str] = set()
+    try:
+        for start in range(0, len(ids), 100):
+            response = index.fetch(ids=ids[start:start + 100], namespace=namespace)
+            for vector_id, vector in response.vectors.items():
+                metadata = getattr(vector, "metadata", None) or {}
+                if metadata.get(CONTENT_HASH_KEY) == hashes.get(vector_id):
+                    unchanged.add(vector_id)
+    except Exception as e:
+        logger.warning(
+            "pinecone_fetch_existing_failed",
+            namespace=namespace,
+            error=str(e),
+            error_type=type(e).__name__
+        )
+    return unchanged
+
+
+def delete_stale_chunks(index, namespace: str, chunk_counts: Dict[str, int]) -> int:
+    """
+    Delete each page's chunks past its current chunk count.
+    
+    After a page shrinks, its old trailing chunks would stay retrievable. The
+    namespace's IDs are listed once (paginated) and every
+    {page_id}::chunk::{n} with n at or past the page's new count is deleted —
+    however large n is, so pages that once exceeded MAX_CHUNKS_PER_PAGE are
+    covered too. Pages not in chunk_counts (page_id → chunks just stored)
+    are left alone.
+    
+    Returns:
+        Number of stale vectors deleted
+    """
+    stale_ids = []
+    for ids_batch in index.list(namespace=namespace):
+        for vector_id in ids_batch:
+            page_id, separator, chunk_index = vector_id.partition("::chunk::")
+            if (
+                separator
+                and page_id in chunk_counts
+                and chunk_index.isdigit()
+                and int(chunk_index) >= chunk_counts[page_id]
+            ):
+                stale_ids.append(vector_id)
+    
+    # Pinecone delete accepts up to 1000 IDs per call
+    for start in range(0, len(stale_ids), 1000):
+        index.delete(ids=stale_ids[start:start + 1000], namespace=namespace)
+    
+    logger.debug(
+        "stale_chunks_deleted",
+        namespace=namespace,
+        pages=len(chunk_counts),
+        deleted=len(stale_ids)
+    )
+    return len(stale_ids)
+
+
+def upsert_nodes(vector_store: "PineconeVectorStore", nodes: List[BaseNode], config: Config) -> None:
+    """
+    Upsert already-embedded nodes, several Pinecone requests at a time.
+    
+    PineconeVectorStore.add() sends its upsert batches one after another;
+    here the nodes are split into config.pinecone_upsert_batch_size slices and
+    up to config.pinecone_upsert_concurrency add() calls run at once (threads —
+    each is a network round-trip). Metadata format and vector IDs are exactly
+    what add() produces on its own.
+    
+    Args:
+        vector_store: Vector store for the target namespace
+        nodes: Nodes with embeddings set
+        config: Configuration object with upsert settings
+    """
+    batch_size = config.pinecone_upsert_batch_size
+    batches = [nodes[i:i + batch_size] for i in range(0, len(nodes), batch_size)]
+    workers = max(1, min(config.pinecone_upsert_concurrency, len(batches)))
+    
+    if workers == 1:
+        for batch in batches:
+            vector_store.add(batch)
+        return
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # list() re-raises the first failed upsert
+        list(executor.map(vector_store.add, batches))
+
+
 def get_index_stats(config: Config) -> dict:
     """
     Get statistics about a Pinecone index.
@@ -288,9 +572,7 @@ def get_index_stats(config: Config) -> dict:
         Dictionary with index statistics
     """
     try:
-        pc = Pinecone(api_key=config.pinecone_api_key)
-        index = pc.Index(config.pinecone_index_name)
-        stats = index.describe_index_stats()
+        stats = get_pinecone_index(config).describe_index_stats()
         
         logger.debug(
             "index_stats_retrieved",
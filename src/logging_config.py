@@ -9,10 +9,85 @@ This provides JSON-structured logs that are:
 """
 
 import logging
+import logging.handlers
+import queue
 import sys
 import structlog
 from pathlib import Path
 
+# Fast JSON for rendering log lines - orjson when installed, falling back to
+# the standard library json module (structlog's default)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# logging's own source-file marker, kept so a later DEBUG setup can restore
+# caller lookup after a non-DEBUG one disabled it
+_STDLIB_SRCFILE = logging._srcfile
+
+
+def _orjson_dumps(event_dict, **kw) -> str:
+    """JSONRenderer serializer using orjson (structlog passes its repr fallback as default=)."""
+    return orjson.dumps(event_dict, default=kw.get("default"), option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+class _DeferredFlushFileHandler(logging.FileHandler):
+    """FileHandler whose emit() leaves the line in the stream buffer; flush() writes it out."""
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        # StreamHandler.emit minus its per-record flush
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _DrainingQueueListener(logging.handlers.QueueListener):
+    """QueueListener that flushes its handlers whenever the queue runs empty."""
+    
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        if block:
+            try:
+                return self.queue.get_nowait()
+            except queue.Empty:
+                # Burst written — one flush for all of it, then wait
+                for handler in self.handlers:
+                    handler.flush()
+        return self.queue.get(block)
+
+
+class BackgroundFileHandler(logging.handlers.QueueHandler):
+    """
+    Log file writing moved off the logging thread.
+    
+    Logging a record only enqueues it; a QueueListener thread writes it to
+    the file, flushing once per burst (whenever the queue empties) rather than
+    once per record. close() (run by logging.shutdown at exit, and when
+    setup_logging reconfigures) stops the listener after it has written
+    everything queued.
+    """
+    
+    def __init__(self, log_file: str):
+        log_queue = queue.SimpleQueue()
+        super().__init__(log_queue)
+        self._file_handler = _DeferredFlushFileHandler(log_file, encoding='utf-8')
+        self._listener = _DrainingQueueListener(log_queue, self._file_handler)
+        self._listener.start()
+    
+    def close(self) -> None:
+        if self._listener is not None:
+            self._listener.stop()  # Drains the queue first
+            self._listener = None
+            self._file_handler.close()
+        super().close()
+
 
 def setup_logging(log_level: str = "INFO", log_file: str = None):
     """
@@ -31,6 +106,13 @@ def setup_logging(log_level: str = "INFO", log_file: str = None):
     # Convert log level string to logging constant
     numeric_level = getattr(logging, log_level.upper(), logging.INFO)
     
+    # Skip LogRecord fields the "%(message)s" format never shows. Caller lookup
+    # (funcName/lineno) walks the stack on every record; keep it for DEBUG only.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging._srcfile = _STDLIB_SRCFILE if numeric_level <= logging.DEBUG else None
+    
     # Configure structlog processors (the pipeline that processes each log)
     structlog.configure(
         processors=[
@@ -45,10 +127,14 @@ def setup_logging(log_level: str = "INFO", log_file: str = None):
             # Decode unicode (handle special characters)
             structlog.processors.UnicodeDecoder(),
             # Render as JSON (production-ready format)
-            structlog.processors.JSONRenderer()
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps)
+            if ORJSON_AVAILABLE else structlog.processors.JSONRenderer()
         ],
         # Context is stored in a dict
         context_class=dict,
+        # Calls below the level return at once, before the event dict is built
+        # or any processor runs
+        wrapper_class=structlog.make_filtering_bound_logger(numeric_level),
         # Use standard library logging
         logger_factory=structlog.stdlib.LoggerFactory(),
         # Cache logger on first use (performance optimization)
@@ -69,7 +155,8 @@ def setup_logging(log_level: str = "INFO", log_file: str = None):
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
         
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        # Written by a background thread (logging only enqueues)
+        file_handler = BackgroundFileHandler(log_file)
         file_handler.setLevel(numeric_level)
         handlers.append(file_handler)
     
@@ -14,7 +14,10 @@ Features:
 
 import structlog
 import json
-from typing import List, Dict, Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 import redis
 
@@ -22,12 +25,102 @@ from src.config import Config, get_config
 
 logger = structlog.get_logger(__name__)
 
+# Fast JSON for the per-message turn (de)serialization - orjson when
+# installed, falling back to the standard library json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps(turn: Dict):
+    """Serialize a turn (bytes with orjson, str otherwise — Redis stores both as-is)."""
+    return orjson.dumps(turn) if ORJSON_AVAILABLE else json.dumps(turn)
+
+
+def _loads(turn_json: str) -> Dict:
+    """Parse a stored turn."""
+    return orjson.loads(turn_json) if ORJSON_AVAILABLE else json.loads(turn_json)
+
+
+# One connection pool per Redis server, shared by every ConversationMemory in
+# the process, so new instances reuse kept-alive sockets instead of opening
+# their own. Blocking: when all connections are busy, callers wait (up to the
+# socket timeout) rather than opening unbounded extra connections.
+REDIS_MAX_CONNECTIONS = 32
+_pools: Dict[Tuple[str, int, int, str], redis.BlockingConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def _get_pool(config: Config) -> redis.BlockingConnectionPool:
+    """Shared connection pool for the configured Redis server."""
+    key = (config.redis_host, config.redis_port, config.redis_db, config.redis_password)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = redis.BlockingConnectionPool(
+                host=config.redis_host,
+                port=config.redis_port,
+                password=config.redis_password if config.redis_password else None,
+                db=config.redis_db,
+                decode_responses=True,  # Automatically decode bytes to strings
+                socket_connect_timeout=5,  # 5 second timeout
+                socket_timeout=5,
+                socket_keepalive=True,
+                max_connections=REDIS_MAX_CONNECTIONS,
+                timeout=5,  # Max wait for a free connection
+            )
+        return pool
+
+
+# Counter bumped whenever knowledge-base content changes (Notion ingestion or
+# sync). The agent puts it in its answer-cache keys, so every process serving
+# answers stops reusing ones from before the change.
+CONTENT_VERSION_KEY = "content_version"
+
+
+def bump_content_version(config: Config = None) -> bool:
+    """
+    Mark the knowledge base as changed (call after writing to Pinecone).
+    
+    Best-effort: if Redis is unreachable, cached answers still expire after
+    config.query_cache_ttl_seconds.
+    
+    Returns:
+        True if the version was bumped
+    """
+    config = config or get_config()
+    try:
+        version = redis.Redis(connection_pool=_get_pool(config)).incr(CONTENT_VERSION_KEY)
+        logger.info("content_version_bumped", version=version)
+        return True
+    except Exception as e:
+        logger.warning(
+            "content_version_bump_failed",
+            error=str(e),
+            error_type=type(e).__name__
+        )
+        return False
+
+
+# After a failed connection, reconnect lazily: first retry after this long,
+# doubling per failure up to the cap (a successful connect resets it)
+RECONNECT_INITIAL_BACKOFF_SECONDS = 1.0
+RECONNECT_MAX_BACKOFF_SECONDS = 60.0
+
+# get_context_string layout
+CONTEXT_HEADER = "Previous conversation (NOT A SOURCE OF TRUTH (for conversational context only, NOT facts)):"
+CONTEXT_TURN_TEMPLATE = "User previously asked: {}\nAssistant previously replied (MAY BE WRONG): {}\n"
+
 
 class ConversationMemory:
     """
     Manages conversation history using Redis.
     
-    Each conversation is stored as a list of Q&A pairs with automatic expiration.
+    Each conversation is a Redis LIST of JSON-encoded Q&A turns (oldest
+    first) with automatic expiration. Adding a turn only sends that turn;
+    reads fetch just the turns they need.
     """
     
     def __init__(self, config: Config = None):
@@ -39,10 +132,20 @@ class ConversationMemory:
         """
         self.config = config or get_config()
         self.redis_client = None
+        self._reconnect_backoff = RECONNECT_INITIAL_BACKOFF_SECONDS
+        self._next_reconnect_at = 0.0
+        
+        # Write-through copy of recent conversations: user_id -> (expires_at, turns).
+        # add_turn keeps it in step with Redis, so a query's history read is
+        # served locally instead of costing a round-trip. Only enabled via
+        # config.conversation_cache_size (single-process deployments).
+        self._turn_cache: "OrderedDict[str, Tuple[float, List[Dict]]]" = OrderedDict()
+        self._turn_cache_lock = threading.Lock()
+        
         self._connect()
     
     def _connect(self):
-        """Establish connection to Redis"""
+        """Establish connection to Redis (on failure, schedules the next attempt)"""
         try:
             logger.info(
                 "redis_connection_started",
@@ -50,17 +153,8 @@ class ConversationMemory:
                 port=self.config.redis_port
             )
             
-            # Create Redis connection
-            self.redis_client = redis.Redis(
-                host=self.config.redis_host,
-                port=self.config.redis_port,
-                password=self.config.redis_password if self.config.redis_password else None,
-                db=self.config.redis_db,
-                decode_responses=True,  # Automatically decode bytes to strings
-                socket_connect_timeout=5,  # 5 second timeout
-                socket_timeout=5,
-
-            )
+            # Redis client on the shared connection pool
+            self.redis_client = redis.Redis(connection_pool=_get_pool(self.config))
             
             # Test connection
             self.redis_client.ping()
@@ -68,8 +162,11 @@ class ConversationMemory:
                 "redis_connected",
                 host=self.config.redis_host,
                 port=self.config.redis_port,
-                db=self.config.redis_db
+                db=self.config.redis_db,
+                # redis-py picks the C reply parser automatically when installed
+                hiredis=redis.utils.HIREDIS_AVAILABLE
             )
+            self._reconnect_backoff = RECONNECT_INITIAL_BACKOFF_SECONDS
             
         except redis.ConnectionError as e:
             logger.error(
@@ -79,15 +176,46 @@ class ConversationMemory:
                 host=self.config.redis_host,
                 port=self.config.redis_port
             )
-            logger.warning("conversation_memory_disabled", reason="redis_unavailable")
-            self.redis_client = None
+            logger.warning(
+                "conversation_memory_disabled",
+                reason="redis_unavailable",
+                retry_in_seconds=self._reconnect_backoff
+            )
+            self._schedule_reconnect()
         except Exception as e:
             logger.error(
                 "redis_connection_unexpected_error",
                 error=str(e),
                 error_type=type(e).__name__
             )
-            self.redis_client = None
+            self._schedule_reconnect()
+    
+    def _schedule_reconnect(self):
+        """Drop the client and allow the next connection attempt after the current backoff."""
+        self.redis_client = None
+        self._next_reconnect_at = time.monotonic() + self._reconnect_backoff
+        self._reconnect_backoff = min(self._reconnect_backoff * 2, RECONNECT_MAX_BACKOFF_SECONDS)
+    
+    def _ensure_connected(self) -> bool:
+        """
+        True if a Redis client is available, reconnecting once the backoff has passed.
+        
+        While Redis is down, calls in between fail fast instead of each
+        waiting for a connect timeout.
+        """
+        if self.redis_client is None and time.monotonic() >= self._next_reconnect_at:
+            self._connect()
+        return self.redis_client is not None
+    
+    def _handle_redis_error(self, error: Exception):
+        """Treat a lost connection like a failed connect (other errors leave the client alone)."""
+        if isinstance(error, (redis.ConnectionError, redis.TimeoutError)):
+            logger.warning(
+                "redis_connection_lost",
+                error=str(error),
+                retry_in_seconds=self._reconnect_backoff
+            )
+            self._schedule_reconnect()
       
     def _get_key(self, user_id: str) -> str:
         """
@@ -101,6 +229,44 @@ class ConversationMemory:
         """
         return f"conversation:{user_id}"
     
+    def _cached_turns(self, user_id: str) -> Optional[List[Dict]]:
+        """Locally cached turns for a user, or None (not cached or past the TTL)."""
+        with self._turn_cache_lock:
+            entry = self._turn_cache.get(user_id)
+            if entry is None:
+                return None
+            if time.monotonic() >= entry[0]:
+                # Redis has expired the conversation by now too
+                del self._turn_cache[user_id]
+                return None
+            self._turn_cache.move_to_end(user_id)
+            return entry[1]
+    
+    def _cache_turns(self, user_id: str, turns: List[Dict], ttl_seconds: Optional[float] = None):
+        """
+        Store a user's turns locally, evicting the least recently used user.
+        
+        Args:
+            ttl_seconds: Remaining lifetime of the Redis key (default: a fresh TTL,
+                as after add_turn)
+        """
+        cache_size = self.config.conversation_cache_size
+        if cache_size <= 0:
+            return
+        if ttl_seconds is None:
+            ttl_seconds = self.config.conversation_ttl_seconds
+        expires_at = time.monotonic() + ttl_seconds
+        with self._turn_cache_lock:
+            self._turn_cache[user_id] = (expires_at, turns)
+            self._turn_cache.move_to_end(user_id)
+            while len(self._turn_cache) > cache_size:
+                self._turn_cache.popitem(last=False)
+    
+    def _forget_turns(self, user_id: str):
+        """Drop a user's cached turns (next read goes to Redis)."""
+        with self._turn_cache_lock:
+            self._turn_cache.pop(user_id, None)
+    
     def add_turn(self, user_id: str, question: str, answer: str) -> bool:
         """
         Add a Q&A turn to the conversation history.
@@ -113,7 +279,7 @@ class ConversationMemory:
         Returns:
             True if successful, False otherwise
         """
-        if not self.redis_client:
+        if not self._ensure_connected():
             logger.warning(
                 "conversation_save_skipped",
                 reason="redis_unavailable",
@@ -131,34 +297,37 @@ class ConversationMemory:
                 'timestamp': datetime.utcnow().isoformat()
             }
             
-            # Get existing conversation
-            conversation = self.get_conversation(user_id)
-            
-            # Add new turn
-            conversation.append(turn)
-            
-            # Keep only last N turns (configurable)
             max_turns = self.config.max_conversation_turns
-            if len(conversation) > max_turns:
-                conversation = conversation[-max_turns:]
+            try:
+                total_turns = self._append_turn(key, turn, max_turns)
+            except redis.ResponseError as e:
+                if "WRONGTYPE" not in str(e):
+                    raise
+                # Conversation stored in the old format (one JSON string) —
+                # start over; it would have expired within the TTL anyway
+                self.redis_client.delete(key)
+                total_turns = self._append_turn(key, turn, max_turns)
             
-            # Save back to Redis with TTL
-            self.redis_client.setex(
-                name=key,
-                time=self.config.conversation_ttl_seconds,
-                value=json.dumps(conversation)
-            )
+            # Mirror the append locally (a first turn needs no prior history)
+            cached = self._cached_turns(user_id)
+            if cached is not None:
+                self._cache_turns(user_id, (cached + [turn])[-max_turns:])
+            elif total_turns == 1:
+                self._cache_turns(user_id, [turn])
             
             logger.debug(
                 "conversation_turn_saved",
                 user_id=user_id,
-                total_turns=len(conversation),
+                total_turns=total_turns,
                 max_turns=max_turns,
                 ttl_seconds=self.config.conversation_ttl_seconds
             )
             return True
             
         except Exception as e:
+            # Unknown whether the turn was stored — stop trusting the local copy
+            self._forget_turns(user_id)
+            self._handle_redis_error(e)
             logger.error(
                 "conversation_save_failed",
                 error=str(e),
@@ -167,17 +336,32 @@ class ConversationMemory:
             )
             return False
     
-    def get_conversation(self, user_id: str) -> List[Dict]:
+    def _append_turn(self, key: str, turn: Dict, max_turns: int) -> int:
+        """
+        Append a turn, keep the last max_turns and refresh the TTL (one round-trip).
+        
+        Returns:
+            Number of turns stored after the append
+        """
+        pipe = self.redis_client.pipeline(transaction=False)
+        pipe.rpush(key, _dumps(turn))
+        pipe.ltrim(key, -max_turns, -1)
+        pipe.expire(key, self.config.conversation_ttl_seconds)
+        length_after_push = pipe.execute()[0]
+        return min(length_after_push, max_turns)
+    
+    def get_conversation(self, user_id: str, max_turns: Optional[int] = None) -> List[Dict]:
         """
         Get conversation history for a user.
         
         Args:
             user_id: User identifier
+            max_turns: Only return the most recent N turns (default: all stored)
             
         Returns:
-            List of conversation turns (Q&A pairs)
+            List of conversation turns (Q&A pairs), oldest first
         """
-        if not self.redis_client:
+        if not self._ensure_connected():
             logger.warning(
                 "conversation_retrieval_skipped",
                 reason="redis_unavailable",
@@ -185,21 +369,55 @@ class ConversationMemory:
             )
             return []
         
+        cached = self._cached_turns(user_id)
+        if cached is not None:
+            conversation = cached[-max_turns:] if max_turns else list(cached)
+            logger.debug(
+                "conversation_retrieved",
+                user_id=user_id,
+                turns_count=len(conversation),
+                source="cache"
+            )
+            return conversation
+        
         try:
             key = self._get_key(user_id)
+            caching = self.config.conversation_cache_size > 0
             
-            # Get conversation from Redis
-            conversation_json = self.redis_client.get(key)
+            # Get (the tail of) the conversation from Redis. When it is cached
+            # afterwards: all of it (at most max_conversation_turns) plus its
+            # remaining TTL, in the same round-trip
+            try:
+                if caching:
+                    pipe = self.redis_client.pipeline(transaction=False)
+                    pipe.lrange(key, 0, -1)
+                    pipe.pttl(key)
+                    turns_json, ttl_ms = pipe.execute()
+                else:
+                    start = -max_turns if max_turns else 0
+                    turns_json = self.redis_client.lrange(key, start, -1)
+            except redis.ResponseError as e:
+                if "WRONGTYPE" not in str(e):
+                    raise
+                # Old format (one JSON string) — replaced on the next add_turn
+                turns_json, ttl_ms = [], -2
             
-            if not conversation_json:
+            # Parse JSON
+            conversation = [_loads(turn_json) for turn_json in turns_json]
+            if caching:
+                # Expire the local copy when Redis expires the key (-2: no key yet)
+                ttl_seconds = ttl_ms / 1000 if ttl_ms > 0 else self.config.conversation_ttl_seconds
+                self._cache_turns(user_id, conversation, ttl_seconds)
+                if max_turns:
+                    conversation = conversation[-max_turns:]
+            
+            if not conversation:
                 logger.debug(
                     "conversation_not_found",
                     user_id=user_id
                 )
                 return []
             
-            # Parse JSON
-            conversation = json.loads(conversation_json)
             logger.debug(
                 "conversation_retrieved",
                 user_id=user_id,
@@ -209,6 +427,7 @@ class ConversationMemory:
             return conversation
             
         except Exception as e:
+            self._handle_redis_error(e)
             logger.error(
                 "conversation_retrieval_failed",
                 error=str(e),
@@ -225,31 +444,48 @@ class ConversationMemory:
             user_id: User identifier
             max_turns: Maximum number of recent turns to include (default: 5)
         """
-        conversation = self.get_conversation(user_id)
-        
-        if not conversation:
+        if max_turns <= 0:
             return ""
         
-        # Only use last N turns
-        recent_conversation = conversation[-max_turns:] if len(conversation) > max_turns else conversation
+        # Only fetch the last N turns
+        recent_conversation = self.get_conversation(user_id, max_turns=max_turns)
+        
+        if not recent_conversation:
+            return ""
         
         logger.debug(
             "context_string_generated",
             user_id=user_id,
-            total_turns=len(conversation),
             included_turns=len(recent_conversation),
             max_turns=max_turns
         )
         
-        # Build context string
-        context_parts = ["Previous conversation (NOT A SOURCE OF TRUTH (for conversational context only, NOT facts)):"]
+        # Build context string (header line, then one blank-line-separated block per turn)
+        return CONTEXT_HEADER + "\n" + "\n".join(
+            CONTEXT_TURN_TEMPLATE.format(turn['question'], turn['answer'])
+            for turn in recent_conversation
+        )
+    
+    def get_content_version(self) -> Optional[str]:
+        """
+        Current knowledge-base content version (see bump_content_version).
         
-        for turn in recent_conversation:  # ← ONLY RECENT TURNS!
-            context_parts.append(f"User previously asked: {turn['question']}")
-            context_parts.append(f"Assistant previously replied (MAY BE WRONG): {turn['answer']}")
-            context_parts.append("")
+        Returns:
+            The version ("0" if never bumped), or None if Redis is unavailable
+        """
+        if not self._ensure_connected():
+            return None
         
-        return "\n".join(context_parts)
+        try:
+            return self.redis_client.get(CONTENT_VERSION_KEY) or "0"
+        except Exception as e:
+            self._handle_redis_error(e)
+            logger.warning(
+                "content_version_read_failed",
+                error=str(e),
+                error_type=type(e).__name__
+            )
+            return None
     
     def clear_conversation(self, user_id: str) -> bool:
         """
@@ -261,7 +497,7 @@ class ConversationMemory:
         Returns:
             True if successful, False otherwise
         """
-        if not self.redis_client:
+        if not self._ensure_connected():
             logger.warning(
                 "conversation_clear_skipped",
                 reason="redis_unavailable",
@@ -271,6 +507,7 @@ class ConversationMemory:
         
         try:
             key = self._get_key(user_id)
+            self._forget_turns(user_id)
             self.redis_client.delete(key)
             logger.info(
                 "conversation_cleared",
@@ -279,6 +516,7 @@ class ConversationMemory:
             return True
             
         except Exception as e:
+            self._handle_redis_error(e)
             logger.error(
                 "conversation_clear_failed",
                 error=str(e),
@@ -294,27 +532,30 @@ class ConversationMemory:
         Returns:
             Dictionary with stats
         """
-        if not self.redis_client:
+        if not self._ensure_connected():
             return {'error': 'Redis not available'}
         
         try:
-            # Count conversation keys
-            pattern = "conversation:*"
-            keys = self.redis_client.keys(pattern)
+            # Count conversation keys (SCAN, not KEYS — KEYS blocks Redis
+            # for the whole keyspace walk)
+            total_conversations = sum(
+                1 for _ in self.redis_client.scan_iter(match="conversation:*", count=1000)
+            )
             
             stats = {
-                'total_conversations': len(keys),
+                'total_conversations': total_conversations,
                 'redis_connected': True,
             }
             
             logger.debug(
                 "memory_stats_retrieved",
-                total_conversations=len(keys)
+                total_conversations=total_conversations
             )
             
             return stats
             
         except Exception as e:
+            self._handle_redis_error(e)
             logger.error(
                 "memory_stats_failed",
                 error=str(e),
@@ -329,7 +570,7 @@ class ConversationMemory:
         Returns:
             True if connected, False otherwise
         """
-        if not self.redis_client:
+        if not self._ensure_connected():
             return False
         
         try: